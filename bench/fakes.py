@@ -0,0 +1,153 @@
+# bench/fakes.py — FarhunVerse | Local stand-ins for OpenAI and SMTP so benchmarks run offline
+#
+#   with FakeOpenAI() as openai, FakeSMTP() as smtp:
+#       env = {**openai.env(), **smtp.env()}
+
+import hashlib
+import json
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Server:
+    """Run a socketserver on 127.0.0.1:<free port> in a daemon thread."""
+
+    server = None
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, name=type(self).__name__, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    @property
+    def port(self):
+        return self.server.server_address[1]
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+# -----------------------------------------------
+# 🤖 OPENAI — /v1/embeddings (hash vectors) + /v1/chat/completions (JSON or SSE stream)
+# -----------------------------------------------
+class FakeOpenAI(_Server):
+    def __init__(self, latency=0.05, token_delay=0.002, dim=64):
+        fake = self
+        self.latency = latency
+        self.token_delay = token_delay
+        self.dim = dim
+        self.requests = {"embeddings": 0, "chat": 0}
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                if self.path.endswith("/embeddings"):
+                    fake.requests["embeddings"] += 1
+                    self._json(fake.embeddings(body))
+                elif self.path.endswith("/chat/completions"):
+                    fake.requests["chat"] += 1
+                    fake.chat(self, body)
+                else:
+                    self.send_error(404)
+
+            def _json(self, payload):
+                data = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+
+    def env(self):
+        return {"OPENAI_API_KEY": "sk-fake", "OPENAI_BASE_URL": f"http://127.0.0.1:{self.port}/v1"}
+
+    def embeddings(self, body):
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        data = []
+        for i, text in enumerate(inputs):
+            digest = hashlib.sha256(json.dumps(text).encode()).digest() * (self.dim // 32 + 1)
+            data.append({"object": "embedding", "index": i, "embedding": [(b - 128) / 128 for b in digest[: self.dim]]})
+        return {"object": "list", "data": data, "model": body.get("model"), "usage": {"prompt_tokens": 1, "total_tokens": 1}}
+
+    def chat(self, handler, body):
+        question = body["messages"][-1]["content"]
+        answer = f"I specialize in AI and Linux automation. You asked: {question[:60]}"
+        time.sleep(self.latency)
+        if not body.get("stream"):
+            handler._json({
+                "id": "fake", "object": "chat.completion", "created": 0, "model": body["model"],
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": answer}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            })
+            return
+        handler.send_response(200)
+        handler.send_header("Content-Type", "text/event-stream")
+        handler.end_headers()
+        for word in answer.split(" "):
+            chunk = {
+                "id": "fake", "object": "chat.completion.chunk", "created": 0, "model": body["model"],
+                "choices": [{"index": 0, "delta": {"content": word + " "}, "finish_reason": None}],
+            }
+            handler.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            handler.wfile.flush()
+            time.sleep(self.token_delay)
+        handler.wfile.write(b"data: [DONE]\n\n")
+
+
+# -----------------------------------------------
+# ✉️ SMTP — just enough of RFC 5321 for smtplib (EHLO, MAIL, RCPT, DATA, NOOP, RSET, QUIT)
+# -----------------------------------------------
+class FakeSMTP(_Server):
+    def __init__(self):
+        fake = self
+        self.messages = []
+        self.connections = 0
+
+        class Handler(socketserver.StreamRequestHandler):
+            def reply(self, line):
+                self.wfile.write(line.encode() + b"\r\n")
+
+            def handle(self):
+                fake.connections += 1
+                self.reply("220 fake ESMTP ready")
+                for raw in self.rfile:
+                    command = raw.decode(errors="replace").strip().split(" ", 1)[0].upper()
+                    if command == "EHLO":
+                        self.reply("250-fake")
+                        self.reply("250 8BITMIME")
+                    elif command in ("HELO", "MAIL", "RCPT", "NOOP", "RSET"):
+                        self.reply("250 OK")
+                    elif command == "DATA":
+                        self.reply("354 End data with <CR><LF>.<CR><LF>")
+                        lines = []
+                        for data in self.rfile:
+                            if data in (b".\r\n", b".\n"):
+                                break
+                            lines.append(data[1:] if data.startswith(b"..") else data)
+                        fake.messages.append(b"".join(lines))
+                        self.reply("250 OK queued")
+                    elif command == "QUIT":
+                        self.reply("221 Bye")
+                        return
+                    else:
+                        self.reply("502 Command not implemented")
+
+        self.server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+
+    def env(self):
+        return {"SMTP_HOST": "127.0.0.1", "SMTP_PORT": str(self.port), "SMTP_SECURITY": "plain"}
@@ -0,0 +1,388 @@
+# bench/loadtest.py — FarhunVerse | Concurrent visitor sessions against a live `streamlit run`
+#
+# Serves a scratch copy of the tree with OpenAI/SMTP faked (see bench/render.py)
+# and drives it with simulated browsers that speak the frontend's websocket
+# protocol (BackMsg / ForwardMsg protobufs on /_stcore/stream). Every visitor
+# lands on Home and tours the pages; some ask FarhunBot a question, some submit
+# the contact form. Reports sessions/s, rerun latency percentiles, server CPU
+# and RSS per session (from /proc) and whether the view counter kept up.
+#
+#   python bench/loadtest.py --sessions 200 --concurrency 50
+#   python bench/loadtest.py --sessions 500 --concurrency 200 --think 0 --output load.json
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from tornado.httpclient import HTTPRequest
+from tornado.websocket import websocket_connect
+
+from fakes import FakeOpenAI, FakeSMTP
+from render import bench_env, copy_working_tree, percentile
+
+TOUR = ["Tech Showcase", "AI Resume Navigator", "Beyond the Code", "Contact"]
+QUESTIONS = [
+    "What are your skills?",
+    "Which projects used LangChain?",
+    "Tell me about your blockchain work.",
+    "What hackathons have you won?",
+    "Do you have DevOps experience?",
+]
+CLK_TCK = os.sysconf("SC_CLK_TCK")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+# -----------------------------------------------
+# 🌐 SIMULATED BROWSER
+# -----------------------------------------------
+class LoadStats:
+    def __init__(self):
+        self.latency = defaultdict(list)  # step -> seconds from BackMsg to script_finished
+        self.completed = 0
+        self.landed = 0  # sessions whose first run finished, i.e. that were counted as a view
+        self.failures = Counter()
+        self.exceptions = Counter()  # st.exception elements rendered by the app
+        self.questions = 0
+        self.submissions = 0
+
+
+class Visitor:
+    """One browser tab: a websocket session plus the page hashes and widget ids it has been sent."""
+
+    def __init__(self, base_url, stats):
+        self.base_url = base_url
+        self.stats = stats
+        self.ws = None
+        self.pages = {}  # page title -> (script hash, url path)
+        self.current = ""  # script hash of the page on screen
+        self.widgets = {}  # widget label (or element type) -> id, for the page on screen
+        self.cached = set()  # hashes of cacheable messages, echoed back like the frontend does
+
+    async def connect(self):
+        request = HTTPRequest(
+            self.base_url.replace("http", "ws", 1) + "/_stcore/stream",
+            headers={"Origin": self.base_url},
+        )
+        self.ws = await websocket_connect(request, subprotocols=["streamlit"], max_message_size=64 * 1024 * 1024)
+
+    def close(self):
+        if self.ws is not None:
+            self.ws.close()
+
+    async def rerun(self, step, page=None, widgets=()):
+        msg = BackMsg()
+        state = msg.rerun_script
+        if page is not None:
+            state.page_script_hash, state.page_name = self.pages[page]
+        else:
+            state.page_script_hash = self.current
+        state.cached_message_hashes.extend(self.cached)
+        state.widget_states.widgets.extend(widgets)
+        self.widgets = {}
+
+        start = time.perf_counter()
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+        while True:
+            raw = await self.ws.read_message()
+            if raw is None:
+                raise ConnectionError("server closed the websocket")
+            fwd = ForwardMsg()
+            fwd.ParseFromString(raw)
+            if fwd.metadata.cacheable and fwd.hash:
+                self.cached.add(fwd.hash)
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                self._see(fwd.delta.new_element)
+            elif kind == "navigation":
+                self.pages = {p.page_name: (p.page_script_hash, p.url_pathname) for p in fwd.navigation.app_pages}
+                self.current = fwd.navigation.page_script_hash
+            elif kind == "script_finished":
+                if fwd.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    raise RuntimeError(f"{step}: script failed to compile")
+                if fwd.script_finished == ForwardMsg.FINISHED_SUCCESSFULLY:
+                    break
+        self.stats.latency[step].append(time.perf_counter() - start)
+
+    def _see(self, element):
+        kind = element.WhichOneof("type")
+        if kind == "exception":
+            self.stats.exceptions[element.exception.message[:120]] += 1
+        elif kind == "chat_input":
+            self.widgets["chat_input"] = element.chat_input.id
+        elif kind in ("text_input", "text_area", "button"):
+            proto = getattr(element, kind)
+            self.widgets[proto.label] = proto.id
+
+    def text(self, label, value):
+        return WidgetState(id=self.widgets[label], string_value=value)
+
+    def trigger(self, label):
+        return WidgetState(id=self.widgets[label], trigger_value=True)
+
+    def chat(self, value):
+        state = WidgetState(id=self.widgets["chat_input"])
+        state.chat_input_value.data = value
+        return state
+
+
+async def visit(visitor, rng, args):
+    async def think():
+        if args.think:
+            await asyncio.sleep(rng.uniform(0, args.think))
+
+    await visitor.connect()
+    try:
+        await visitor.rerun("Home")
+        visitor.stats.landed += 1
+        for title in TOUR:
+            await think()
+            await visitor.rerun(title, page=title)
+            if title == "AI Resume Navigator" and rng.random() < args.chat_ratio:
+                await think()
+                await visitor.rerun("ask", widgets=[visitor.chat(rng.choice(QUESTIONS))])
+                visitor.stats.questions += 1
+            elif title == "Contact" and rng.random() < args.contact_ratio:
+                await think()
+                await visitor.rerun("submit", widgets=[
+                    visitor.text("Your Name", f"Visitor {id(visitor)}"),
+                    visitor.text("Your Email", "visitor@example.com"),
+                    visitor.text("Your Message", "Load test message"),
+                    visitor.trigger("Send Message"),
+                ])
+                visitor.stats.submissions += 1
+    finally:
+        visitor.close()
+
+
+# -----------------------------------------------
+# 🖥️ SERVER — `streamlit run` in a scratch tree, sampled through /proc
+# -----------------------------------------------
+def cpu_seconds(pid):
+    fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / CLK_TCK  # utime + stime
+
+
+def rss_mb(pid):
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def start_server(tree, env, port, log):
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", "app.py",
+            "--server.headless=true", f"--server.port={port}", "--server.address=127.0.0.1",
+            "--server.fileWatcherType=none", "--server.runOnSave=false", "--browser.gatherUsageStats=false",
+        ],
+        cwd=tree, env=env, stdout=log, stderr=subprocess.STDOUT,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"streamlit exited with {proc.returncode}; see {log.name}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as r:
+                if r.status == 200:
+                    return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("streamlit did not become healthy within 60s")
+
+
+def stop_server(proc):
+    proc.send_signal(signal.SIGTERM)  # graceful: lets the counter/feedback stores flush at exit
+    try:
+        proc.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+def read_views(tree):
+    try:
+        with sqlite3.connect(tree / "view_count.db") as conn:
+            row = conn.execute("SELECT value FROM counters WHERE name = 'views'").fetchone()
+        db = row[0] if row else 0
+    except sqlite3.Error:
+        db = None
+    try:
+        snapshot = json.loads((tree / "view_count.json").read_text()).get("views")
+    except (OSError, ValueError):
+        snapshot = None
+    return db, snapshot
+
+
+async def sample(pid, samples, stop, interval=0.25):
+    while not stop.is_set():
+        samples.append((time.monotonic(), cpu_seconds(pid), rss_mb(pid)))
+        try:
+            await asyncio.wait_for(stop.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def drive(base_url, pid, args):
+    # One full visit first so the index, caches and derivatives exist before the clock starts
+    warmup = LoadStats()
+    await visit(Visitor(base_url, warmup), random.Random(args.seed), argparse.Namespace(**{
+        **vars(args), "think": 0, "chat_ratio": 1, "contact_ratio": 1,
+    }))
+
+    stats = LoadStats()
+    gate = asyncio.Semaphore(args.concurrency)
+
+    async def one(i):
+        async with gate:
+            try:
+                await visit(Visitor(base_url, stats), random.Random(args.seed + i + 1), args)
+                stats.completed += 1
+            except Exception as exc:
+                stats.failures[f"{type(exc).__name__}: {exc}"[:120]] += 1
+
+    idle_rss, cpu_before = rss_mb(pid), cpu_seconds(pid)
+    samples, stop = [], asyncio.Event()
+    sampler = asyncio.create_task(sample(pid, samples, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(args.sessions)))
+    wall = time.perf_counter() - start
+    stop.set()
+    await sampler
+    cpu_used = cpu_seconds(pid) - cpu_before
+    return warmup, stats, {
+        "wall_s": wall,
+        "cpu_s": cpu_used,
+        "idle_rss_mb": idle_rss,
+        "peak_rss_mb": max((rss for _, _, rss in samples), default=idle_rss),
+    }
+
+
+# -----------------------------------------------
+# 📋 REPORT
+# -----------------------------------------------
+def summarize(args, warmup, stats, server, views, mail, llm_calls):
+    sessions = stats.completed or 1
+    all_latency = [s for values in stats.latency.values() for s in values]
+
+    def pcts(values):
+        return {f"p{int(q * 100)}_ms": round(percentile(values, q) * 1000, 1) for q in (0.5, 0.95, 0.99)} if values else {}
+
+    expected_views = views["before"] + warmup.landed + stats.landed
+    return {
+        "sessions": args.sessions,
+        "concurrency": args.concurrency,
+        "completed": stats.completed,
+        "failed": dict(stats.failures),
+        "app_exceptions": dict(stats.exceptions),
+        "wall_s": round(server["wall_s"], 2),
+        "sessions_per_s": round(stats.completed / server["wall_s"], 2),
+        "reruns_per_s": round(len(all_latency) / server["wall_s"], 2),
+        "latency": {"all": pcts(all_latency), **{step: pcts(v) for step, v in stats.latency.items()}},
+        "server": {
+            "cpu_s": round(server["cpu_s"], 2),
+            "cpu_ms_per_session": round(server["cpu_s"] / sessions * 1000, 1),
+            "cpu_util": round(server["cpu_s"] / server["wall_s"], 2),  # 1.0 = one core busy
+            "idle_rss_mb": round(server["idle_rss_mb"], 1),
+            "peak_rss_mb": round(server["peak_rss_mb"], 1),
+            "rss_mb_per_concurrent_session": round(
+                (server["peak_rss_mb"] - server["idle_rss_mb"]) / min(args.concurrency, args.sessions), 2
+            ),
+        },
+        "views": {
+            "expected": expected_views,
+            "db": views["db"],
+            "json": views["json"],
+            "consistent": views["db"] == views["json"] == expected_views,
+        },
+        "mail": {"submitted": warmup.submissions + stats.submissions, "delivered": mail},
+        "llm": {"questions": warmup.questions + stats.questions, "chat_requests": llm_calls},
+    }
+
+
+def print_summary(r):
+    print(f"\n{r['completed']}/{r['sessions']} sessions in {r['wall_s']}s at concurrency {r['concurrency']}: "
+          f"{r['sessions_per_s']} sessions/s, {r['reruns_per_s']} reruns/s")
+    for reason, n in r["failed"].items():
+        print(f"  failed x{n}: {reason}")
+    for message, n in r["app_exceptions"].items():
+        print(f"  app exception x{n}: {message}")
+    print(f"\n{'rerun':<22} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for step, p in r["latency"].items():
+        if p:
+            print(f"{step:<22} {p['p50_ms']:>9.1f} {p['p95_ms']:>9.1f} {p['p99_ms']:>9.1f}")
+    s = r["server"]
+    print(f"\nserver: {s['cpu_s']}s CPU ({s['cpu_ms_per_session']} ms/session, {s['cpu_util']:.0%} of a core), "
+          f"RSS {s['idle_rss_mb']} -> {s['peak_rss_mb']} MB ({s['rss_mb_per_concurrent_session']} MB per concurrent session)")
+    v = r["views"]
+    status = "OK" if v["consistent"] else "MISMATCH"
+    print(f"views: expected {v['expected']}, view_count.db {v['db']}, view_count.json {v['json']} — {status}")
+    print(f"mail: {r['mail']['delivered']}/{r['mail']['submitted']} contact submissions delivered to the fake SMTP server")
+    print(f"llm: {r['llm']['chat_requests']} chat completions for {r['llm']['questions']} questions (answer cache + coalescing)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulated concurrent visitors against `streamlit run app.py`")
+    parser.add_argument("--sessions", type=int, default=100, help="visitor sessions in total (default: 100)")
+    parser.add_argument("--concurrency", type=int, default=25, help="sessions open at once (default: 25)")
+    parser.add_argument("--think", type=float, default=0.5, help="max random pause between clicks, seconds (default: 0.5)")
+    parser.add_argument("--chat-ratio", type=float, default=0.3, help="share of visitors asking FarhunBot (default: 0.3)")
+    parser.add_argument("--contact-ratio", type=float, default=0.1, help="share of visitors submitting the form (default: 0.1)")
+    parser.add_argument("--llm-latency", type=float, default=0.3, help="fake OpenAI time to first token, seconds (default: 0.3)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="also write the results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, FakeOpenAI(latency=args.llm_latency) as openai, FakeSMTP() as smtp:
+        tree = Path(tmp)
+        copy_working_tree(tree)
+        views_before = json.loads((tree / "view_count.json").read_text()).get("views", 0)
+        port = free_port()
+        with open(tree / "streamlit.log", "w") as log:
+            proc = start_server(tree, bench_env(openai, smtp), port, log)
+            try:
+                warmup, stats, server = asyncio.run(drive(f"http://127.0.0.1:{port}", proc.pid, args))
+                submitted = warmup.submissions + stats.submissions
+                deadline = time.monotonic() + 15
+                while len(smtp.messages) < submitted and time.monotonic() < deadline:
+                    time.sleep(0.2)  # give the outbox worker a moment to drain
+            finally:
+                stop_server(proc)
+        db, snapshot = read_views(tree)
+        result = summarize(
+            args, warmup, stats, server, {"before": views_before, "db": db, "json": snapshot},
+            len(smtp.messages), openai.requests["chat"],
+        )
+        if stats.failures or stats.exceptions:
+            print((tree / "streamlit.log").read_text()[-3000:])
+
+    print_summary(result)
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"\nwrote {args.output}")
+    sys.exit(0 if result["views"]["consistent"] and not stats.failures else 1)
+
+
+if __name__ == "__main__":
+    main()
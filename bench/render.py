@@ -0,0 +1,250 @@
+# bench/render.py — FarhunVerse | Headless per-page render benchmark
+#
+# Each scenario runs in its own interpreter against a scratch copy of the tree:
+# the page is rendered once (first render) and then rerun N times through
+# Streamlit's AppTest. OpenAI and SMTP are served by bench/fakes.py, Lottie
+# runs offline and any other outbound request is pointed at a dead proxy, so
+# the numbers never depend on the network.
+#
+#   python bench/render.py                              # measure, write bench/render_baseline.json
+#   python bench/render.py --baseline old.json          # ...and diff against an earlier run
+#   python bench/render.py --compare HEAD~1 --runs 10   # ...or against a git revision
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from fakes import FakeOpenAI, FakeSMTP
+from startup import ROOT, copy_working_tree, export_revision
+
+DEFAULT_OUTPUT = ROOT / "bench" / "render_baseline.json"
+
+# name -> (page script, interaction performed on every rerun)
+SCENARIOS = {
+    "Home": ("pages/home.py", None),
+    "Tech Showcase": ("pages/tech_showcase.py", None),
+    "AI Resume Navigator": ("pages/resume_navigator.py", None),
+    "AI Resume Navigator (ask)": ("pages/resume_navigator.py", "ask"),
+    "Beyond the Code": ("pages/beyond_the_code.py", None),
+    "Contact": ("pages/contact.py", None),
+    "Contact (submit)": ("pages/contact.py", "submit"),
+}
+
+# Runs inside the child interpreter: streamlit is imported before the clock starts
+PROBE = r"""
+import json, os, resource, sys, time
+sys.path.insert(0, os.getcwd())
+from streamlit.testing.v1 import AppTest
+
+page, action, runs = sys.argv[1], sys.argv[2], int(sys.argv[3])
+opens = 0
+counting = False
+
+def audit(event, args):
+    global opens
+    if counting and event == "open":
+        opens += 1
+
+sys.addaudithook(audit)
+
+def text_bytes(at):
+    elements = [*at.markdown, *at.caption, *at.title, *at.header, *at.subheader]
+    return sum(len(str(e.value).encode()) for e in elements)
+
+def interact(at, i):
+    if action == "ask":
+        at.chat_input[0].set_value(f"Question {i}: which projects used LangChain?")
+    elif action == "submit":
+        at.text_input[0].set_value("Bench")
+        at.text_input[1].set_value("bench@example.com")
+        at.text_area[0].set_value(f"Render benchmark message {i}")
+        at.button[0].click()
+
+at = AppTest.from_file("app.py", default_timeout=120)
+start = time.perf_counter()
+at.run()
+if page != "pages/home.py":
+    at.switch_page(page).run()
+first = time.perf_counter() - start
+
+counting = True
+samples = []
+for i in range(runs):
+    interact(at, i)
+    start = time.perf_counter()
+    at.run()
+    samples.append(time.perf_counter() - start)
+counting = False
+
+# Submitted mail must leave the outbox before this interpreter (and its daemon worker) exits
+mail = {}
+try:
+    from core.mailer import OUTBOX_DB, get_mail_outbox
+except ImportError:
+    OUTBOX_DB = None  # --compare against a revision that still sent mail inline
+if action == "submit" and OUTBOX_DB is not None:
+    import sqlite3
+
+    deadline = time.monotonic() + 30
+    while get_mail_outbox().pending_count() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    with sqlite3.connect(OUTBOX_DB) as conn:
+        counts = dict(conn.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall())
+    mail = {"pending": counts.get("pending", 0) + counts.get("sending", 0), "dead": counts.get("dead", 0)}
+
+exceptions = [e.value for e in at.exception]
+if mail.get("pending") or mail.get("dead"):
+    exceptions.append(f"mail left undelivered: {mail['pending']} pending, {mail['dead']} dead")
+
+print(json.dumps({
+    "first_s": first,
+    "samples_s": samples,
+    "opens": opens,
+    "text_bytes": text_bytes(at),
+    "elements": len(list(at.main)) + len(list(at.sidebar)),
+    "maxrss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "mail": mail,
+    "exceptions": exceptions,
+}))
+"""
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q
+    lo, hi = int(rank), min(int(rank) + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (rank - lo)
+
+
+def bench_env(openai, smtp):
+    return dict(
+        os.environ,
+        **openai.env(),
+        **smtp.env(),
+        EMAIL_USER="bench@example.com",
+        EMAIL_PASS="",
+        EMBEDDING_PROVIDER="hashing",  # offline and deterministic; chat still goes through the fake
+        FARHUNVERSE_WARMUP="0",
+        FARHUNVERSE_PERF="0",
+        LOTTIE_OFFLINE="1",
+        HTTP_PROXY="http://127.0.0.1:9",  # anything not faked fails fast instead of reaching out
+        HTTPS_PROXY="http://127.0.0.1:9",
+        NO_PROXY="127.0.0.1,localhost",
+    )
+
+
+def probe(tree, env, page, action, runs):
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, page, action or "-", str(runs)],
+        cwd=tree, env=env, capture_output=True, text=True,
+    )
+    if out.returncode != 0:
+        raise RuntimeError(f"{page} probe failed:\n{out.stderr[-2000:]}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def measure(tree, env, runs, smtp):
+    # One untimed pass so on-disk caches (index, derivatives, favicon) exist before measuring
+    for page, _ in dict.fromkeys(SCENARIOS.values()):
+        probe(tree, env, page, None, 1)
+
+    results = {}
+    for name, (page, action) in SCENARIOS.items():
+        sent_before = len(smtp.messages)
+        r = probe(tree, env, page, action, runs)
+        ms = [s * 1000 for s in r["samples_s"]]
+        if r["mail"]:
+            r["mail"]["delivered"] = len(smtp.messages) - sent_before
+            if r["mail"]["delivered"] != runs:
+                r["exceptions"].append(f"{r['mail']['delivered']} of {runs} submitted mails reached SMTP")
+        results[name] = {
+            "first_ms": round(r["first_s"] * 1000, 1),
+            "median_ms": round(statistics.median(ms), 1),
+            "p95_ms": round(percentile(ms, 0.95), 1),
+            "opens_per_run": round(r["opens"] / runs, 1),
+            "text_bytes": r["text_bytes"],
+            "elements": r["elements"],
+            "maxrss_mb": round(r["maxrss_kb"] / 1024, 1),
+            "mail": r["mail"],
+            "exceptions": r["exceptions"],
+        }
+    return results
+
+
+def run_tree(label, rev, runs):
+    with tempfile.TemporaryDirectory() as tmp, FakeOpenAI() as openai, FakeSMTP() as smtp:
+        tree = Path(tmp)
+        if rev:
+            export_revision(rev, tmp)
+        else:
+            copy_working_tree(tree)
+        pages = measure(tree, bench_env(openai, smtp), runs, smtp)
+        return {
+            "label": label,
+            "runs": runs,
+            "python": platform.python_version(),
+            "fakes": {"openai_requests": dict(openai.requests), "smtp_messages": len(smtp.messages)},
+            "pages": pages,
+        }
+
+
+def print_report(report):
+    print(f"\n== {report['label']}  ({report['runs']} reruns per page, Python {report['python']})")
+    print(f"{'scenario':<27} {'first':>8} {'median':>8} {'p95':>8} {'opens':>6} {'text KB':>8} {'RSS MB':>7}")
+    for name, r in report["pages"].items():
+        print(f"{name:<27} {r['first_ms']:>8.1f} {r['median_ms']:>8.1f} {r['p95_ms']:>8.1f} "
+              f"{r['opens_per_run']:>6.1f} {r['text_bytes'] / 1024:>8.1f} {r['maxrss_mb']:>7.1f}")
+        if r.get("mail"):
+            mail = r["mail"]
+            print(f"{'':>29}mail: {mail['delivered']} delivered, {mail['pending']} pending, {mail['dead']} dead")
+        for exc in r["exceptions"]:
+            print(f"{'':>29}exception: {exc[:200]}")
+
+
+def print_diff(new, old):
+    print(f"\n== {new['label']} vs {old['label']}")
+    print(f"{'scenario':<27} {'median ms':>18} {'opens':>14} {'text bytes':>18} {'RSS MB':>14}")
+    for name, r in new["pages"].items():
+        before = old["pages"].get(name)
+        if before is None:
+            print(f"{name:<27} (not in baseline)")
+            continue
+        cells = []
+        for key, width in (("median_ms", 18), ("opens_per_run", 14), ("text_bytes", 18), ("maxrss_mb", 14)):
+            delta = r[key] - before[key]
+            pct = f" {delta / before[key] * 100:+.0f}%" if before[key] else ""
+            cells.append(f"{delta:+.1f}{pct}".rjust(width))
+        print(f"{name:<27}" + " ".join(cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-page render time, payload and file opens for app.py")
+    parser.add_argument("--runs", type=int, default=5, help="reruns per page after the first render (default: 5)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="where to write this run's JSON")
+    parser.add_argument("--baseline", type=Path, metavar="JSON", help="diff against an earlier --output file")
+    parser.add_argument("--compare", metavar="REV", help="also measure this git revision and diff against it")
+    args = parser.parse_args()
+
+    report = run_tree("working tree", None, args.runs)
+    print_report(report)
+    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"\nwrote {args.output}")
+
+    if args.baseline:
+        old = json.loads(args.baseline.read_text(encoding="utf-8"))
+        old["label"] = f"{args.baseline.name} ({old['label']})"
+        print_diff(report, old)
+    if args.compare:
+        old = run_tree(args.compare, args.compare, args.runs)
+        print_report(old)
+        print_diff(report, old)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# bench/startup.py — FarhunVerse | Cold-start timing for app.py
+#
+# Renders the Home page once in a fresh interpreter (Streamlit AppTest) and
+# reports the first-run time plus which heavy modules that run imported. Runs
+# happen in a scratch copy, so the visitor counter and caches here stay untouched.
+#
+#   python bench/startup.py                    # measure the working tree
+#   python bench/startup.py --compare HEAD~1   # ...next to a git revision
+#
+# Lottie is rendered from local copies only (LOTTIE_OFFLINE=1). A revision that
+# fetched animations synchronously renders none of them here, so it also skips
+# the pandas/pyarrow import Streamlit's custom-component call triggers — compare
+# the heavy-module lists, not just the seconds, against such revisions.
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+from io import BytesIO
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = [
+    "plotly.graph_objects",
+    "PyPDF2",
+    "PIL.ImageFilter",
+    "requests",
+    "streamlit_lottie",
+    "pandas",  # + pyarrow: imported by Streamlit on the first custom-component (st_lottie) call
+    "pyarrow",
+    "streamlit.emojis",  # emoji icon validation in st.Page
+    "faiss",
+    "langchain_openai",
+]
+
+# Runs inside the child interpreter: streamlit itself is imported before the clock starts
+PROBE = r"""
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+
+heavy = json.loads(sys.argv[1])
+start = time.perf_counter()
+at = AppTest.from_file("app.py", default_timeout=120)
+at.run()
+elapsed = time.perf_counter() - start
+
+def loaded(name):
+    mod = sys.modules.get(name)
+    return mod is not None and type(mod).__name__ != "_LazyModule"
+
+print(json.dumps({
+    "seconds": elapsed,
+    "exceptions": [e.value for e in at.exception],
+    "modules": len(sys.modules),
+    "heavy_loaded": [name for name in heavy if loaded(name)],
+}))
+"""
+
+
+def measure(tree, runs):
+    env = dict(os.environ, FARHUNVERSE_WARMUP="0", LOTTIE_OFFLINE="1")
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE, json.dumps(HEAVY_MODULES)],
+            cwd=tree, env=env, capture_output=True, text=True, check=True,
+        )
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return {
+        "median_s": round(statistics.median(s["seconds"] for s in samples), 3),
+        "min_s": round(min(s["seconds"] for s in samples), 3),
+        "modules": samples[-1]["modules"],
+        "heavy_loaded": samples[-1]["heavy_loaded"],
+        "exceptions": samples[-1]["exceptions"],
+    }
+
+
+def copy_working_tree(dest):
+    """Tracked + untracked (non-ignored) files only, so local caches and state files stay out."""
+    dest = Path(dest)
+    listed = subprocess.run(
+        ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+        cwd=ROOT, capture_output=True, check=True,
+    ).stdout.decode().split("\0")
+    for name in filter(None, listed):
+        src = ROOT / name
+        if src.is_file():
+            (dest / name).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(src, dest / name)
+
+
+def export_revision(rev, dest):
+    archive = subprocess.run(["git", "archive", rev], cwd=ROOT, capture_output=True, check=True).stdout
+    with tarfile.open(fileobj=BytesIO(archive)) as tar:
+        tar.extractall(dest)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start timing for the Home page of app.py")
+    parser.add_argument("--runs", type=int, default=5, help="cold starts per tree (default: 5)")
+    parser.add_argument("--compare", metavar="REV", help="also measure this git revision")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        copy_working_tree(tmp)
+        results["working tree"] = measure(tmp, args.runs)
+    if args.compare:
+        with tempfile.TemporaryDirectory() as tmp:
+            export_revision(args.compare, tmp)
+            results[args.compare] = measure(tmp, args.runs)
+
+    for label, r in results.items():
+        print(f"{label:>14}: median {r['median_s']:.3f}s  (min {r['min_s']:.3f}s)  "
+              f"{r['modules']} modules  heavy: {', '.join(r['heavy_loaded']) or '-'}")
+        for exc in r["exceptions"]:
+            print(f"{'':>16}exception: {exc}")
+    if len(results) == 2:
+        (_, new), (_, old) = results.items()
+        print(f"{'gain':>14}: {old['median_s'] - new['median_s']:+.3f}s on Home's first render")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+# core/__init__.py — FarhunVerse | Shared state and helpers for every page
+#
+# app.py (the st.navigation entrypoint) and the scripts in pages/ import from
+# these modules; they are imported once per process, so nothing here is
+# re-executed on a rerun.
@@ -0,0 +1,106 @@
+# core/charts.py — FarhunVerse | Plotly figures for the Tech Showcase
+
+import plotly.graph_objects as go
+import streamlit as st
+
+def radar_chart(skills, template="plotly_dark"):
+    categories = list(skills.keys())
+    # Custom proficiency values
+    values_map = {
+        "AI / ML": 85,
+        "Blockchain": 70,
+        "Devops / Automation": 60,
+        "Cloud & Infra": 65,
+    }
+    values = [values_map.get(cat, 50) for cat in categories]  # default 50 if not mapped
+    fig = go.Figure(go.Scatterpolar(r=values, theta=categories, fill='toself'))
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+        showlegend=False,
+        template=template,
+    )
+    return fig
+
+def languages_bar(efficiency_by_language, template=None):
+    languages = list(efficiency_by_language)
+    efficiency = list(efficiency_by_language.values())
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=efficiency,
+        y=languages,
+        orientation='h',
+        marker=dict(
+            color=efficiency,
+            colorscale="blues",
+            line=dict(color='rgba(255,255,255,0.2)', width=1)
+        ),
+        text=[f"{v}%" for v in efficiency],
+        textposition="outside",
+        hovertemplate='%{y}: %{x}%',
+    ))
+    fig.update_layout(
+        xaxis=dict(showgrid=False, showticklabels=False, range=[0, 100]),
+        yaxis=dict(showgrid=False),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color="#e2e8f0", size=14),
+        margin=dict(l=80, r=50, t=20, b=40),
+        height=430,
+        transition=dict(duration=800, easing="cubic-in-out"),
+    )
+    if template:
+        fig.update_layout(template=template)
+    return fig
+
+def frameworks_donut(proficiency_by_framework, template=None):
+    frameworks = list(proficiency_by_framework)
+    proficiency = list(proficiency_by_framework.values())
+    fig = go.Figure(go.Pie(
+        labels=frameworks,
+        values=proficiency,
+        hole=0.45,
+        marker=dict(
+            colors=[
+                "#00b4d8", "#0077b6", "#90e0ef", "#48cae4",
+                "#00bfff", "#5ce1e6", "#219ebc", "#023e8a", "#8ecae6"
+            ],
+            line=dict(color='rgba(0,0,0,0)', width=1)
+        ),
+        text=[f"{v}%" for v in proficiency],  # show actual %
+        textinfo="text",
+        hovertemplate='%{label}: %{value}%',
+    ))
+    fig.update_layout(
+        showlegend=True,
+        legend_title_text="Frameworks",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color="#e2e8f0", size=13),
+        margin=dict(l=40, r=40, t=20, b=40),
+        height=500,
+        transition=dict(duration=800, easing="cubic-in-out"),
+    )
+    if template:
+        fig.update_layout(template=template)
+    return fig
+
+CHART_BUILDERS = {
+    "radar": radar_chart,
+    "languages": languages_bar,
+    "frameworks": frameworks_donut,
+}
+
+# -----------------------------------------------
+# 🗃️ FIGURE CACHE — build, validate and serialize once per (chart, data, theme)
+# -----------------------------------------------
+@st.cache_data(show_spinner=False)
+def cached_plotly_chart(kind, data, template=None, theme="streamlit", use_container_width=True):
+    """Draw chart ``kind`` for ``data``; reruns replay the recorded element.
+
+    st.cache_data records the plotly_chart element (with its serialized
+    JSON spec) on the first call and re-sends it on every hit, so reruns
+    skip building, validating and serializing the figure. (The module import
+    itself is not deferred — streamlit already loads plotly.graph_objects.)
+    """
+    fig = CHART_BUILDERS[kind](data, template)
+    st.plotly_chart(fig, theme=theme, use_container_width=use_container_width)
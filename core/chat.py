@@ -0,0 +1,334 @@
+# core/chat.py — FarhunVerse | FarhunBot chain, streaming and answer cache
+
+import atexit
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import streamlit as st
+
+from core.flight import TokenFlight, get_answer_flights, get_openai_limiter, shared_call
+from core.perf import bind_thread, current_trace, span
+from core.settings import CACHE_DIR, OPENAI_API_KEY, get_openai_http_client, temp_path_for
+
+# 💾 FarhunBot answer cache — exact + near-duplicate questions, per resume index
+ANSWER_CACHE_FILE = CACHE_DIR / "answers.json"  # entries; their vectors live beside it in answers.npy
+
+def normalize_question(question):
+    """Lowercase, drop punctuation and collapse whitespace: 'What are your skills?' → 'what are your skills'."""
+    import re
+
+    return " ".join(re.sub(r"[^\w\s]", " ", question.lower()).split())
+
+class AnswerCache:
+    """LRU + TTL cache of answers, persisted to disk and tied to one resume index.
+
+    Exact hits on the normalized question are free; otherwise the question is
+    embedded and the closest cached question is reused when its cosine
+    similarity reaches ``threshold``. Question vectors are kept unit-length
+    in one preallocated float32 matrix (one row per entry), so a lookup is a
+    single dot product. ``store`` only marks the cache dirty: a background
+    thread writes the entries (JSON) and the matrix (.npy) at most every
+    ``save_delay`` seconds, off the request path. Entries saved under a
+    different index key are discarded on load, so a new resume invalidates
+    every answer.
+    """
+
+    def __init__(self, path, index_key, embed_query, threshold=0.92, max_entries=256, ttl=7 * 24 * 3600, save_delay=2.0):
+        from collections import OrderedDict
+
+        self.path = Path(path)
+        self.vectors_path = self.path.with_suffix(".npy")
+        self.index_key = index_key
+        self.embed_query = embed_query
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.save_delay = save_delay
+        self._entries = OrderedDict()  # normalized question -> {"answer", "ts", "row"}
+        self._vectors = None  # (max_entries, dim) float32, unit rows; allocated on first vector
+        self._row_keys = [None] * max_entries  # row -> question key using it
+        self._lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._load()
+        threading.Thread(target=self._save_loop, name="answer-cache-writer", daemon=True).start()
+        atexit.register(self.save)
+
+    def _load(self):
+        import numpy as np
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            vectors = np.load(self.vectors_path)
+        except (OSError, ValueError):
+            return
+        if (
+            saved.get("index_key") != self.index_key
+            or saved.get("vectors_digest") != _digest(vectors)
+            or vectors.ndim != 2
+            or len(vectors) != self.max_entries
+        ):
+            return  # other index, capacity change or a torn save — start fresh
+        self._vectors = vectors.astype("float32", copy=False)
+        now = time.time()
+        for key, entry in saved.get("entries", []):
+            row = entry.get("row")
+            if now - entry["ts"] < self.ttl and isinstance(row, int) and 0 <= row < self.max_entries:
+                self._entries[key] = entry
+                self._row_keys[row] = key
+        for row, key in enumerate(self._row_keys):
+            if key is None:
+                self._vectors[row] = 0.0
+
+    def save(self):
+        """Write the cache now if anything changed since the last save."""
+        if not self._dirty.is_set():
+            return
+        with self._lock:
+            self._dirty.clear()
+            entries = [(k, dict(e)) for k, e in self._entries.items()]
+            vectors = None if self._vectors is None else self._vectors.copy()
+        if vectors is None:
+            return
+        import numpy as np
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_vectors = temp_path_for(self.vectors_path)
+            with open(tmp_vectors, "wb") as f:
+                np.save(f, vectors)
+            os.replace(tmp_vectors, self.vectors_path)
+            tmp_path = temp_path_for(self.path)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"index_key": self.index_key, "vectors_digest": _digest(vectors), "entries": entries}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            self._dirty.set()  # disk full / permissions — try again on the next tick
+
+    def _save_loop(self):
+        while True:
+            self._dirty.wait()
+            time.sleep(self.save_delay)  # coalesce bursts of stores into one write
+            self.save()
+
+    def _drop(self, key):
+        entry = self._entries.pop(key)
+        self._row_keys[entry["row"]] = None
+        self._vectors[entry["row"]] = 0.0
+
+    def _evict_expired(self, now):
+        for key in [k for k, e in self._entries.items() if now - e["ts"] >= self.ttl]:
+            self._drop(key)
+
+    def lookup(self, question):
+        """Return ``(answer or None, query vector or None)``; the vector can be passed to ``store``."""
+        import numpy as np
+
+        key = normalize_question(question)
+        now = time.time()
+        with self._lock:
+            self._evict_expired(now)
+            entry = self._entries.get(key)
+            if entry:
+                self._entries.move_to_end(key)
+                return entry["answer"], None
+            if not self._entries:
+                return None, None
+
+        vector = _unit(np.asarray(self.embed_query(question), dtype="float32"))
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != len(vector):
+                return None, vector
+            sims = self._vectors @ vector  # rows are unit-length; free rows are zero
+            best = int(np.argmax(sims))
+            best_key = self._row_keys[best]
+            if best_key is not None and sims[best] >= self.threshold:
+                self._entries.move_to_end(best_key)
+                return self._entries[best_key]["answer"], vector
+        return None, vector
+
+    def store(self, question, answer, vector=None):
+        import numpy as np
+
+        if vector is None:
+            vector = self.embed_query(question)
+        vector = _unit(np.asarray(vector, dtype="float32"))
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != len(vector):
+                # First vector (or a new embedding size): allocate the matrix and start over
+                self._vectors = np.zeros((self.max_entries, len(vector)), dtype="float32")
+                self._entries.clear()
+                self._row_keys = [None] * self.max_entries
+            key = normalize_question(question)
+            if key in self._entries:
+                self._drop(key)
+            if len(self._entries) >= self.max_entries:
+                self._drop(next(iter(self._entries)))  # least recently used
+            row = self._row_keys.index(None)
+            self._vectors[row] = vector
+            self._row_keys[row] = key
+            self._entries[key] = {"answer": answer, "ts": time.time(), "row": row}
+            self._dirty.set()
+
+def _unit(vector):
+    import numpy as np
+
+    return vector / (np.linalg.norm(vector) + 1e-9)
+
+def _digest(vectors):
+    import hashlib
+
+    return hashlib.blake2b(vectors.tobytes(), digest_size=16).hexdigest()
+
+@st.cache_resource(show_spinner=False)
+def get_answer_cache(index_key, _embeddings):
+    """One shared AnswerCache per resume index (a new index key starts it fresh)."""
+    def embed_query(question):
+        # Sessions asking the same question together share one embedding request
+        return shared_call(("embed", index_key, question), lambda: _embeddings.embed_query(question))
+
+    return AnswerCache(ANSWER_CACHE_FILE, index_key, embed_query)
+
+# 🤖 FarhunBot chain — prompt, LLMs and memory
+CHAT_MODEL = "gpt-4o-mini"
+
+FARHUNBOT_SYSTEM_PROMPT = """
+        You are FarhunBot — an intelligent, friendly AI assistant built by Mohamed Farhun M.
+        Your purpose is to help users understand Mohamed’s professional background, skills, projects, and achievements.
+
+        Core Info about Mohamed:
+        - Full Name: Mohamed Farhun M
+        - Profession: AI & Linux Engineer at HCLTech
+        - Expertise: AI/ML, DevOps, GenAI, Automation, Cloud Infrastructure
+        - Key Skills: Python, Streamlit, Jenkins, Docker, LangChain, AWS, Azure, Linux
+        - Awards: Multi-time Hackathon Winner (Celo, NEAR, Rootstock, Daisi)
+        - Motto: "Innovate with purpose, automate with intelligence."
+        - Passionate about building intelligent, self-healing systems combining AI and infrastructure automation.
+
+        Use the following context from Mohamed’s resume to answer accurately:
+        {context}
+
+        Rules:
+        - Always answer confidently.
+        - Never say “I don’t know.”
+        - Speak in first person (“I specialize in...”) as if you are Mohamed Farhun.
+        - Be concise, friendly, and technically sound.
+        - Context passages start with their resume page, e.g. [Resume p.2]; cite it as (p. 2) when you use a specific detail.
+        """
+
+@st.cache_resource(show_spinner=False)
+def get_qa_prompt():
+    from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
+
+    return ChatPromptTemplate.from_messages([
+        SystemMessagePromptTemplate.from_template(FARHUNBOT_SYSTEM_PROMPT),
+        HumanMessagePromptTemplate.from_template("{question}")
+    ])
+
+@st.cache_resource(show_spinner=False)
+def get_document_prompt():
+    """How each retrieved chunk is rendered into {context} — tagged with its resume page."""
+    from langchain.prompts import PromptTemplate
+
+    return PromptTemplate.from_template("[Resume p.{page}] {page_content}")
+
+def build_qa_chain(vectorstore, index_key):
+    from langchain.chains import ConversationalRetrievalChain
+    from langchain.memory import ConversationBufferMemory
+    from langchain_openai import ChatOpenAI
+
+    from core.retrieval import resume_retriever
+
+    http_client = get_openai_http_client()
+    # Answers stream token by token; the follow-up question rewrite does not
+    llm = ChatOpenAI(openai_api_key=OPENAI_API_KEY, temperature=0.3, model=CHAT_MODEL, streaming=True, http_client=http_client)
+    condense_llm = ChatOpenAI(openai_api_key=OPENAI_API_KEY, temperature=0, model=CHAT_MODEL, http_client=http_client)
+
+    return ConversationalRetrievalChain.from_llm(
+        llm=llm,
+        condense_question_llm=condense_llm,
+        retriever=resume_retriever(vectorstore, index_key, k=3),
+        memory=ConversationBufferMemory(memory_key="chat_history", return_messages=True),
+        combine_docs_chain_kwargs={"prompt": get_qa_prompt(), "document_prompt": get_document_prompt()},
+        return_source_documents=False,
+        verbose=False,
+    )
+
+def sync_chain_memory(memory, history):
+    """Load the chain memory from the session history: a summary of older turns, then the last few verbatim.
+
+    Rebuilt before every question, so the chain's own buffer never outgrows
+    ``MEMORY_TURNS`` turns however long the conversation gets.
+    """
+    from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+    summary, turns = history.llm_context()
+    messages = [SystemMessage(content=summary)] if summary else []
+    for question, answer in turns:
+        messages += [HumanMessage(content=question), AIMessage(content=answer)]
+    memory.clear()
+    memory.chat_memory.add_messages(messages)
+
+def get_session_qa_chain(vectorstore, index_key, history):
+    """The session's QA chain — built on first use and reused until the resume index changes."""
+    cached = st.session_state.get("qa_chain")
+    if cached is None or cached[0] != index_key:
+        st.session_state.qa_chain = (index_key, build_qa_chain(vectorstore, index_key))
+    chain = st.session_state.qa_chain[1]
+    sync_chain_memory(chain.memory, history)
+    return chain
+
+def stream_answer(chain, question, flight_key=None):
+    """Run ``chain`` on a worker thread and yield answer tokens as the LLM produces them.
+
+    Only LLMs created with ``streaming=True`` emit tokens, so the non-streaming
+    question-condensing step of a ConversationalRetrievalChain stays silent.
+    With a ``flight_key``, sessions asking the same thing at the same time
+    share one upstream call: followers replay the leader's stream and record
+    the answer in their own chain memory.
+    """
+    from langchain_core.callbacks import BaseCallbackHandler
+
+    class _TokenFlight(BaseCallbackHandler):
+        def __init__(self, flight):
+            self.flight = flight
+
+        def on_llm_new_token(self, token, **kwargs):
+            self.flight.put(token)
+
+    trace = current_trace()
+
+    def start(flight):
+        def run():
+            bind_thread(trace)
+            try:
+                with span("qa_chain"), get_openai_limiter().slot():
+                    result = chain.invoke({"question": question}, config={"callbacks": [_TokenFlight(flight)]})
+            except Exception as e:
+                flight.finish(error=e)
+            else:
+                flight.finish(result=result)
+
+        threading.Thread(target=run, name="farhunbot-answer", daemon=True).start()
+
+    if flight_key is None:
+        flight, leader = TokenFlight(), True
+        start(flight)
+    else:
+        flight, leader = get_answer_flights().join(flight_key, start)
+
+    streamed = []
+    for token in flight.subscribe():
+        streamed.append(token)
+        yield token
+    if flight.error is not None:
+        raise flight.error
+    if not streamed:
+        # e.g. a model/provider that ignored streaming — still show the answer
+        streamed.append(flight.result["answer"])
+        yield flight.result["answer"]
+    if not leader:
+        chain.memory.save_context({"question": question}, {"answer": "".join(streamed)})
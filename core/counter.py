@@ -0,0 +1,170 @@
+# core/counter.py — FarhunVerse | Visitor counter storage
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import streamlit as st
+
+from core.settings import temp_path_for
+
+# -----------------------------------------------
+# 👁️ VIEW COUNTER STORE
+# -----------------------------------------------
+# JSON snapshot of the counters (kept for readers of view_count.json); SQLite is the source of truth
+COUNTER_FILE = Path("view_count.json")
+COUNTER_DB = Path("view_count.db")
+
+class CounterStore(ABC):
+    """Named counters with atomic increments and cheap, slightly stale reads."""
+
+    @abstractmethod
+    def increment(self, name, amount=1):
+        """Add ``amount`` to counter ``name``."""
+
+    @abstractmethod
+    def get(self, name):
+        """Current value of counter ``name`` (0 if unknown)."""
+
+    def flush(self):
+        """Push any buffered increments to durable storage."""
+
+class SQLiteCounterStore(CounterStore):
+    """SQLite (WAL) counters shared by every session and replica on this host.
+
+    Increments are buffered in-process and written in one ``value = value + ?``
+    transaction every ``flush_interval`` seconds (or once ``flush_threshold``
+    are pending) by a background thread, so concurrent sessions never lose
+    updates and never wait on a busy database. Reads are served from an
+    in-process copy refreshed at most every ``read_ttl`` seconds over a
+    separate connection (WAL readers don't block on the writer).
+    """
+
+    def __init__(self, db_path, snapshot_path=None, read_ttl=5.0, flush_interval=2.0, flush_threshold=50):
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.read_ttl = read_ttl
+        self.flush_threshold = flush_threshold
+        self._lock = threading.Lock()  # in-memory state; never held across DB waits
+        self._write_lock = threading.Lock()  # one flush at a time
+        self._pending = {}
+        self._inflight = {}  # increments being written by flush()
+        self._cached = {}
+        self._cached_at = 0.0
+
+        self._conn = sqlite3.connect(str(db_path), timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        self._seed_from_snapshot()
+        self._read_conn = sqlite3.connect(str(db_path), timeout=10, check_same_thread=False, isolation_level=None)
+
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, args=(flush_interval,), name="counter-flusher", daemon=True
+        )
+        self._flusher.start()
+        atexit.register(self.flush)
+
+    def _seed_from_snapshot(self):
+        # Carry over counts from the legacy JSON file the first time the DB is created
+        if not (self.snapshot_path and self.snapshot_path.exists()):
+            return
+        try:
+            with open(self.snapshot_path, "r") as f:
+                seed = json.load(f)
+        except (OSError, ValueError):
+            return
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO counters (name, value) VALUES (?, ?)",
+            [(name, int(value)) for name, value in seed.items()],
+        )
+
+    def increment(self, name, amount=1):
+        with self._lock:
+            self._pending[name] = self._pending.get(name, 0) + amount
+            should_flush = sum(self._pending.values()) >= self.flush_threshold
+        if should_flush:
+            self._wake.set()  # the flusher writes them; this (script) thread never waits on the DB
+
+    def get(self, name):
+        with self._lock:
+            stale = time.monotonic() - self._cached_at > self.read_ttl
+        if stale:
+            try:
+                fresh = dict(self._read_conn.execute("SELECT name, value FROM counters"))
+            except sqlite3.Error:
+                fresh = None  # keep serving the last copy
+            with self._lock:
+                if fresh is not None:
+                    self._cached = fresh
+                self._cached_at = time.monotonic()
+        with self._lock:
+            # Include this process's not-yet-committed increments
+            return self._cached.get(name, 0) + self._pending.get(name, 0) + self._inflight.get(name, 0)
+
+    def flush(self):
+        with self._write_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._inflight = pending
+            if not pending:
+                return
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")  # may wait up to the busy timeout, outside self._lock
+                try:
+                    self._conn.executemany(
+                        "INSERT INTO counters (name, value) VALUES (?, ?) "
+                        "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                        list(pending.items()),
+                    )
+                    snapshot = dict(self._conn.execute("SELECT name, value FROM counters"))
+                    # Written inside the write transaction so snapshots from racing writers stay ordered
+                    self._write_snapshot(snapshot)
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+            except BaseException:
+                with self._lock:
+                    self._inflight = {}
+                    for name, amount in pending.items():
+                        self._pending[name] = self._pending.get(name, 0) + amount
+                raise
+            with self._lock:
+                self._inflight = {}
+                self._cached = snapshot
+                self._cached_at = time.monotonic()
+
+    def _write_snapshot(self, snapshot):
+        if not self.snapshot_path:
+            return
+        tmp_path = temp_path_for(self.snapshot_path)
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(snapshot, f, indent=4)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError:
+            pass  # the snapshot is a convenience copy; the DB already has the counts
+
+    def _flush_loop(self, interval):
+        while not self._stop.is_set():
+            self._wake.wait(interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                pass  # DB busy/locked — the increments stay pending for the next tick
+
+COUNTER_BACKENDS = {"sqlite": SQLiteCounterStore}
+
+@st.cache_resource(show_spinner=False)
+def get_counter_store():
+    """Process-wide counter store (backend chosen with COUNTER_BACKEND, default sqlite)."""
+    backend = COUNTER_BACKENDS[os.getenv("COUNTER_BACKEND", "sqlite")]
+    return backend(COUNTER_DB, snapshot_path=COUNTER_FILE)
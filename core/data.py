@@ -0,0 +1,41 @@
+# core/data.py — FarhunVerse | Portfolio content shared by the pages
+
+SKILLS = {
+    "AI / ML": ["Python", "LangChain", "Streamlit", "Pandas"],
+    "Blockchain": ["Solidity", "Web3.js", "Smart Contracts", "NEAR", "Celo"],
+    "DevOps / Automation": ["Jenkins", "Docker", "Git", "CI/CD", "Bash"],
+    "Cloud & Infra": ["AWS", "Azure", "Linux", "Monitoring", "ServiceNow (IRIS)"],
+}
+
+SOCIALS = {
+    "GitHub": "https://github.com/MohamedFarhun",
+    "LinkedIn": "https://www.linkedin.com/in/mohamedfarhun/",
+    "Devpost": "https://devpost.com/mohamedfarhun-it20",
+    "Email": "mailto:mohamed.farhunm@hcltech.com",
+}
+
+RESUME_PATH = "resume.pdf"
+
+# Tech Showcase charts — proficiency in %
+LANGUAGE_EFFICIENCY = {
+    "Python": 85,
+    "JavaScript / TypeScript": 60,
+    "Solidity": 65,
+    "SQL": 80,
+    "Shell / Bash": 50,
+    "C / C++": 45,
+    "HTML / CSS": 75,
+    "Java": 40,
+}
+
+FRAMEWORK_PROFICIENCY = {
+    "Streamlit": 95,
+    "Django": 85,
+    "React.js": 70,
+    "LangChain": 80,
+    "Flask": 75,
+    "Node.js / Express": 65,
+    "PyTorch / TensorFlow": 60,
+    "Docker": 70,
+    "Jenkins": 65,
+}
@@ -0,0 +1,108 @@
+# core/embeddings.py — FarhunVerse | Pluggable embedding providers for the resume index
+#
+# EMBEDDING_PROVIDER picks the backend:
+#   openai  — OpenAI text-embedding-3-large (needs OPENAI_API_KEY)
+#   local   — sentence-transformers model on CPU, batched (optional dependency)
+#   hashing — deterministic hashing vectorizer, no model, no network (tests / air-gapped)
+#   auto    — openai with a key, else local when installed, else hashing (default)
+
+import hashlib
+import importlib.util
+import math
+import os
+import re
+
+import streamlit as st
+from langchain_core.embeddings import Embeddings
+
+from core.settings import OPENAI_API_KEY, get_openai_http_client
+
+EMBEDDING_PROVIDER = os.getenv("EMBEDDING_PROVIDER", "auto").lower()
+OPENAI_EMBEDDING_MODEL = "text-embedding-3-large"
+LOCAL_EMBEDDING_MODEL = os.getenv("LOCAL_EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+LOCAL_EMBEDDING_BACKEND = os.getenv("LOCAL_EMBEDDING_BACKEND", "torch")  # or "onnx"
+LOCAL_EMBEDDING_BATCH_SIZE = 32
+HASHING_DIM = 1024
+
+# -----------------------------------------------
+# #️⃣ HASHING — stable across processes (blake2b, not Python's salted hash())
+# -----------------------------------------------
+class HashingEmbeddings(Embeddings):
+    """Signed feature hashing of words + word bigrams, sublinear TF, L2-normalised."""
+
+    def __init__(self, dim=HASHING_DIM):
+        self.dim = dim
+
+    def _embed(self, text):
+        import numpy as np
+
+        words = re.findall(r"\w+", text.lower())
+        features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+        counts = {}
+        for feature in features:
+            h = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little")
+            slot = (h % self.dim, 1.0 if (h >> 63) & 1 else -1.0)
+            counts[slot] = counts.get(slot, 0) + 1
+        vector = np.zeros(self.dim, dtype="float32")
+        for (index, sign), count in counts.items():
+            vector[index] += sign * (1.0 + math.log(count))
+        norm = np.linalg.norm(vector)
+        return (vector / norm if norm else vector).tolist()
+
+    def embed_documents(self, texts):
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._embed(text)
+
+# -----------------------------------------------
+# 🖥️ LOCAL — sentence-transformers on CPU, batched, normalised for cosine search
+# -----------------------------------------------
+class LocalEmbeddings(Embeddings):
+    def __init__(self, model_name=LOCAL_EMBEDDING_MODEL, backend=LOCAL_EMBEDDING_BACKEND, batch_size=LOCAL_EMBEDDING_BATCH_SIZE):
+        from sentence_transformers import SentenceTransformer
+
+        kwargs = {"backend": backend} if backend != "torch" else {}
+        self.model = SentenceTransformer(model_name, device="cpu", **kwargs)
+        self.batch_size = batch_size
+
+    def embed_documents(self, texts):
+        vectors = self.model.encode(
+            list(texts), batch_size=self.batch_size, normalize_embeddings=True, convert_to_numpy=True
+        )
+        return vectors.tolist()
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+# -----------------------------------------------
+# 🔌 PROVIDER SELECTION
+# -----------------------------------------------
+def resolve_embedding_provider(provider=EMBEDDING_PROVIDER):
+    if provider != "auto":
+        return provider
+    if OPENAI_API_KEY:
+        return "openai"
+    if importlib.util.find_spec("sentence_transformers") is not None:
+        return "local"
+    return "hashing"
+
+@st.cache_resource(show_spinner=False)
+def get_embeddings(provider=EMBEDDING_PROVIDER):
+    """Return ``(embeddings, model_id)``; ``model_id`` feeds the resume index key."""
+    provider = resolve_embedding_provider(provider)
+    if provider == "openai":
+        from langchain_openai import OpenAIEmbeddings
+
+        embeddings = OpenAIEmbeddings(
+            model=OPENAI_EMBEDDING_MODEL,
+            api_key=OPENAI_API_KEY,
+            http_client=get_openai_http_client(),
+        )
+        # Bare model name keeps indexes persisted before providers existed valid
+        return embeddings, OPENAI_EMBEDDING_MODEL
+    if provider == "local":
+        return LocalEmbeddings(), f"local:{LOCAL_EMBEDDING_MODEL}:{LOCAL_EMBEDDING_BACKEND}"
+    if provider == "hashing":
+        return HashingEmbeddings(), f"hashing:{HASHING_DIM}"
+    raise ValueError(f"Unknown EMBEDDING_PROVIDER {provider!r} (expected openai, local, hashing or auto)")
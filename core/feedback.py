@@ -0,0 +1,176 @@
+# core/feedback.py — FarhunVerse | Append-only feedback log with an incremental rating aggregate
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+import streamlit as st
+
+from core.settings import temp_path_for
+
+try:
+    import fcntl
+except ImportError:  # Windows — single-process use only
+    fcntl = None
+
+FEEDBACK_LOG = Path("feedback.jsonl")
+FEEDBACK_STATS = Path("feedback_stats.json")
+MAX_FEEDBACK_CHARS = 2000
+RATINGS = range(1, 6)
+
+logger = logging.getLogger(__name__)
+
+def _empty_stats():
+    return {"offset": 0, "count": 0, "total": 0, "histogram": {str(r): 0 for r in RATINGS}}
+
+def _apply(stats, rating):
+    stats["count"] += 1
+    stats["total"] += rating
+    stats["histogram"][str(rating)] = stats["histogram"].get(str(rating), 0) + 1
+
+class FeedbackStore:
+    """Ratings + comments appended to a JSONL log, with a running aggregate kept beside it.
+
+    Submissions are buffered in-process and appended in one write every
+    ``flush_interval`` seconds (or once ``flush_threshold`` are pending) by
+    a background thread, so a session never waits on the file lock or the
+    disk. The aggregate sidecar records the log offset it covers; a flush first
+    folds in any lines beyond that offset (another replica, or a crash
+    between the two writes), so the history is never rescanned. Reads are
+    served from memory, refreshed from the small sidecar every ``read_ttl``
+    seconds.
+    """
+
+    def __init__(self, log_path, stats_path, read_ttl=5.0, flush_interval=2.0, flush_threshold=20):
+        self.log_path = Path(log_path)
+        self.stats_path = Path(stats_path)
+        self.read_ttl = read_ttl
+        self.flush_threshold = flush_threshold
+        self._lock = threading.Lock()  # in-memory state; never held across file I/O
+        self._write_lock = threading.Lock()  # one flush at a time
+        self._pending = []
+        self._inflight = []  # submissions being written by flush()
+        self._stats = self._load_stats()
+        self._stats_at = time.monotonic()
+
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, args=(flush_interval,), name="feedback-flusher", daemon=True
+        )
+        self._flusher.start()
+        atexit.register(self.flush)
+
+    def _load_stats(self):
+        try:
+            with open(self.stats_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return _empty_stats()
+
+    def add(self, rating, text=""):
+        rating = int(rating)
+        if rating not in RATINGS:
+            raise ValueError(f"rating must be 1-5, got {rating}")
+        record = {"ts": round(time.time(), 3), "rating": rating, "text": (text or "").strip()[:MAX_FEEDBACK_CHARS]}
+        with self._lock:
+            self._pending.append(record)
+            should_flush = len(self._pending) >= self.flush_threshold
+        if should_flush:
+            self._wake.set()  # the flusher writes them; this (script) thread never waits on the disk
+
+    def stats(self):
+        """``{"count", "mean", "histogram"}`` including this process's unflushed submissions."""
+        with self._lock:
+            stale = time.monotonic() - self._stats_at > self.read_ttl
+        if stale:
+            fresh = self._load_stats()  # small sidecar, read outside the lock
+            with self._lock:
+                if not self._inflight:  # mid-flush the sidecar may already count the in-flight records
+                    self._stats = fresh
+                    self._stats_at = time.monotonic()
+        with self._lock:
+            unflushed = self._inflight + self._pending
+            count = self._stats["count"] + len(unflushed)
+            total = self._stats["total"] + sum(r["rating"] for r in unflushed)
+            histogram = {int(r): n for r, n in self._stats["histogram"].items()}
+            for record in unflushed:
+                histogram[record["rating"]] = histogram.get(record["rating"], 0) + 1
+        return {"count": count, "mean": total / count if count else 0.0, "histogram": histogram}
+
+    def flush(self):
+        with self._write_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+                self._inflight = pending
+            if not pending:
+                return
+            try:
+                with open(self.log_path, "ab") as log:
+                    if fcntl:
+                        fcntl.flock(log, fcntl.LOCK_EX)  # serialises replicas; released on close
+                    stats = self._catch_up(self._load_stats())
+                    if stats["offset"] < self.log_path.stat().st_size:
+                        log.write(b"\n")  # terminate a torn line left by an interrupted write
+                    log.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in pending).encode())
+                    log.flush()
+                    for record in pending:
+                        _apply(stats, record["rating"])
+                    stats["offset"] = log.tell()
+                    self._write_stats(stats)
+            except OSError as e:
+                logger.warning("Feedback flush failed, keeping %d submission(s) for the next tick: %r", len(pending), e)
+                with self._lock:
+                    self._inflight = []
+                    self._pending[:0] = pending
+                return
+            with self._lock:
+                self._inflight = []
+                self._stats = stats
+                self._stats_at = time.monotonic()
+
+    def _catch_up(self, stats):
+        """Fold log lines written after ``stats["offset"]`` into ``stats``."""
+        try:
+            size = self.log_path.stat().st_size
+        except OSError:
+            return stats
+        if size < stats["offset"]:
+            stats = _empty_stats()  # log was truncated/replaced — rebuild once
+        if size == stats["offset"]:
+            return stats
+        with open(self.log_path, "rb") as f:
+            f.seek(stats["offset"])
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # partial line from an interrupted write
+                try:
+                    _apply(stats, int(json.loads(line)["rating"]))
+                except (ValueError, KeyError, TypeError):
+                    pass
+                stats["offset"] += len(line)
+        return stats
+
+    def _write_stats(self, stats):
+        tmp_path = temp_path_for(self.stats_path)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(stats, f)
+        os.replace(tmp_path, self.stats_path)
+
+    def _flush_loop(self, interval):
+        while not self._stop.is_set():
+            self._wake.wait(interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Feedback flusher error")  # submissions stay pending for the next tick
+
+@st.cache_resource(show_spinner=False)
+def get_feedback_store():
+    """Process-wide feedback store (feedback.jsonl + feedback_stats.json)."""
+    return FeedbackStore(FEEDBACK_LOG, FEEDBACK_STATS)
@@ -0,0 +1,165 @@
+# core/flight.py — FarhunVerse | Request coalescing + bounded concurrency for upstream (OpenAI) calls
+
+import asyncio
+import contextlib
+import os
+import threading
+
+import streamlit as st
+
+# Max OpenAI requests in flight across all sessions of this process
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))
+
+# -----------------------------------------------
+# 🛫 SINGLE-FLIGHT — concurrent identical calls share one execution
+# -----------------------------------------------
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """``do(key, fn)`` runs ``fn`` once per key at a time; callers arriving meanwhile get its result."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+class TokenFlight:
+    """One streamed upstream answer, replayed to every subscriber from its first token."""
+
+    def __init__(self, on_finish=None):
+        self._cond = threading.Condition()
+        self._on_finish = on_finish
+        self.tokens = []
+        self.finished = False
+        self.result = None
+        self.error = None
+
+    def put(self, token):
+        with self._cond:
+            self.tokens.append(token)
+            self._cond.notify_all()
+
+    def finish(self, result=None, error=None):
+        if self._on_finish is not None:
+            self._on_finish(self)
+        with self._cond:
+            self.result, self.error, self.finished = result, error, True
+            self._cond.notify_all()
+
+    def subscribe(self):
+        position = 0
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: position < len(self.tokens) or self.finished)
+                batch = self.tokens[position:]
+                done = self.finished and position + len(batch) == len(self.tokens)
+            position += len(batch)
+            yield from batch
+            if done:
+                return
+
+class StreamingSingleFlight:
+    """Like SingleFlight, but followers join a live token stream instead of waiting for the end."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def join(self, key, start):
+        """Return ``(flight, is_leader)``; the leader's ``start(flight)`` must eventually call ``finish``."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                return flight, False
+            flight = self._flights[key] = TokenFlight(on_finish=lambda f: self._forget(key, f))
+        start(flight)
+        return flight, True
+
+    def _forget(self, key, flight):
+        # Late arrivals start a fresh call (or hit the answer cache)
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+# -----------------------------------------------
+# 🚦 LIMITER — an asyncio semaphore on a private loop thread, shared by every session thread
+# -----------------------------------------------
+class ConcurrencyLimiter:
+    """Bound concurrent upstream calls; waiters are admitted in FIFO order.
+
+    Streamlit runs each session on its own thread, so the semaphore lives on
+    a dedicated event loop and callers block on ``run_coroutine_threadsafe``.
+    Slots are re-entrant per thread: a chain that already holds one doesn't
+    take a second for its retriever (which could deadlock under load).
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self._loop = asyncio.new_event_loop()
+        self._semaphore = asyncio.Semaphore(limit)
+        self._held = threading.local()
+        threading.Thread(target=self._loop.run_forever, name="openai-limiter", daemon=True).start()
+
+    @contextlib.contextmanager
+    def slot(self):
+        depth = getattr(self._held, "depth", 0)
+        if depth == 0:
+            asyncio.run_coroutine_threadsafe(self._semaphore.acquire(), self._loop).result()
+        self._held.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._held.depth = depth
+            if depth == 0:
+                self._loop.call_soon_threadsafe(self._semaphore.release)
+
+@st.cache_resource(show_spinner=False)
+def get_openai_limiter():
+    return ConcurrencyLimiter(OPENAI_MAX_CONCURRENCY)
+
+@st.cache_resource(show_spinner=False)
+def get_single_flight():
+    """Process-wide SingleFlight for retrievals and query embeddings."""
+    return SingleFlight()
+
+@st.cache_resource(show_spinner=False)
+def get_answer_flights():
+    """Process-wide StreamingSingleFlight for FarhunBot answers."""
+    return StreamingSingleFlight()
+
+def shared_call(key, fn):
+    """Coalesce ``fn`` with identical in-flight calls and run it under the OpenAI limiter."""
+    limiter = get_openai_limiter()
+
+    def limited():
+        with limiter.slot():
+            return fn()
+
+    return get_single_flight().do(key, limited)
@@ -0,0 +1,115 @@
+# core/history.py — FarhunVerse | Bounded per-session chat history
+
+import itertools
+import textwrap
+from collections import deque
+
+MAX_MESSAGES = 40  # verbatim messages kept per session; older turns are folded into the summary
+MAX_CHARS = 40_000  # ...and at most this many characters across them
+MAX_MESSAGE_CHARS = 8_000  # a single stored message is clipped to this
+RENDER_WINDOW = 10  # messages drawn per rerun; "Load earlier" widens it by this much
+MEMORY_TURNS = 4  # recent question/answer pairs handed to the LLM verbatim
+SUMMARY_CHARS = 1_500  # budget for the summary of everything older
+
+class ChatMessage:
+    """One chat bubble — slots instead of a per-message dict."""
+
+    __slots__ = ("role", "content")
+
+    def __init__(self, role, content):
+        self.role = role
+        self.content = content
+
+def _turns(messages):
+    """(question, answer) pairs in order; a question left without an answer is skipped."""
+    question = None
+    for msg in messages:
+        if msg.role == "user":
+            question = msg.content
+        elif question is not None:
+            yield question, msg.content
+            question = None
+
+def _summary_line(question, answer):
+    return f"- Q: {textwrap.shorten(question, 160)} → A: {textwrap.shorten(answer, 220)}"
+
+class ChatHistory:
+    """The session's conversation, bounded in messages and characters.
+
+    Appending past the limits evicts the oldest turn into a short
+    question → answer digest, so memory per session stays flat however long
+    the chat runs. ``visible()`` is the tail the page draws; ``llm_context()``
+    is what the chain remembers: a summary of older turns plus the last
+    ``MEMORY_TURNS`` verbatim.
+    """
+
+    __slots__ = ("messages", "total", "evicted", "shown", "_chars", "_digest", "_digest_chars")
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.messages = deque()
+        self.total = 0  # messages ever appended, evicted ones included
+        self.evicted = 0
+        self.shown = RENDER_WINDOW
+        self._chars = 0
+        self._digest = deque()  # summary lines of evicted turns, oldest first
+        self._digest_chars = 0
+
+    def __len__(self):
+        return len(self.messages)
+
+    def __iter__(self):
+        return iter(self.messages)
+
+    def append(self, role, content):
+        content = content[:MAX_MESSAGE_CHARS]
+        self.messages.append(ChatMessage(role, content))
+        self.total += 1
+        self._chars += len(content)
+        while len(self.messages) > 1 and (len(self.messages) > MAX_MESSAGES or self._chars > MAX_CHARS):
+            self._evict_oldest()
+
+    def _evict_oldest(self):
+        msg = self._pop()
+        if msg.role == "user" and len(self.messages) > 1 and self.messages[0].role == "assistant":
+            self._remember(_summary_line(msg.content, self._pop().content))
+
+    def _pop(self):
+        msg = self.messages.popleft()
+        self._chars -= len(msg.content)
+        self.evicted += 1
+        return msg
+
+    def _remember(self, line):
+        self._digest.append(line)
+        self._digest_chars += len(line) + 1
+        while self._digest_chars > SUMMARY_CHARS and len(self._digest) > 1:
+            self._digest_chars -= len(self._digest.popleft()) + 1
+
+    # -----------------------------------------------
+    # 🪟 RENDERING — only the newest ``shown`` messages are drawn
+    # -----------------------------------------------
+    def visible(self):
+        return list(itertools.islice(self.messages, self.hidden_count(), None))
+
+    def hidden_count(self):
+        return max(len(self.messages) - self.shown, 0)
+
+    def show_earlier(self, count=RENDER_WINDOW):
+        self.shown += count
+
+    # -----------------------------------------------
+    # 🧠 LLM CONTEXT
+    # -----------------------------------------------
+    def llm_context(self, turns=MEMORY_TURNS):
+        """``(summary, [(question, answer), ...])`` — summary of older turns ("" if none) and the recent ones."""
+        pairs = list(_turns(self.messages))
+        split = len(pairs) - turns if turns else len(pairs)
+        older, recent = pairs[:max(split, 0)], pairs[max(split, 0):]
+        lines = list(self._digest) + [_summary_line(q, a) for q, a in older]
+        while sum(len(line) + 1 for line in lines) > SUMMARY_CHARS and len(lines) > 1:
+            lines.pop(0)
+        summary = "Earlier in this conversation (summarized):\n" + "\n".join(lines) if lines else ""
+        return summary, recent
@@ -0,0 +1,254 @@
+# core/images.py — FarhunVerse | Slideshow derivatives, static assets and the FV logo
+
+import base64
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import streamlit as st
+
+from core.perf import timed
+from core.settings import CACHE_DIR, temp_path_for
+
+# 🖼️ Slideshow image derivatives — resized, EXIF-stripped, WebP + JPEG fallback
+IMAGE_CACHE_DIR = CACHE_DIR / "images"
+SLIDE_SIZE = (820, 440)  # matches the .slideshow box on Beyond the Code
+DERIVATIVE_QUALITY = {"webp": 80, "jpeg": 82}
+DERIVATIVE_MIME = {"webp": "image/webp", "jpeg": "image/jpeg"}
+_derivative_lock = threading.Lock()
+
+# Only formats that are actually served: the static route has no image/avif type and inline mode uses WebP
+DERIVATIVE_FORMATS = ["webp", "jpeg"]
+
+# Settings hash — changing size/quality/formats invalidates every derivative
+_DERIVATIVE_PARAMS = hashlib.sha256(
+    json.dumps([SLIDE_SIZE, DERIVATIVE_QUALITY, DERIVATIVE_FORMATS]).encode()
+).hexdigest()[:8]
+
+def _load_derivative_manifest():
+    try:
+        with open(IMAGE_CACHE_DIR / "manifest.json", "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_derivative_manifest(manifest):
+    IMAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = temp_path_for(IMAGE_CACHE_DIR / "manifest.json")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp_path, IMAGE_CACHE_DIR / "manifest.json")
+
+def _render_derivatives(src_path, digest):
+    """Resize into the slideshow box and write one file per derivative format."""
+    from PIL import Image, ImageOps
+
+    with Image.open(src_path) as src:
+        img = ImageOps.exif_transpose(src)
+        if img.mode in ("RGBA", "LA", "P"):
+            img = img.convert("RGBA")
+            # Flatten transparency onto the slideshow's black background
+            flat = Image.new("RGB", img.size, (0, 0, 0))
+            flat.paste(img, mask=img.getchannel("A"))
+            img = flat
+        else:
+            img = img.convert("RGB")
+        img.thumbnail(SLIDE_SIZE, Image.LANCZOS)
+        icc_profile = src.info.get("icc_profile")
+    img.info = {}  # drop EXIF/XMP and any other source metadata
+
+    outputs = {}
+    for fmt in DERIVATIVE_FORMATS:
+        out_name = f"{digest[:16]}-{_DERIVATIVE_PARAMS}.{fmt}"
+        options = {"quality": DERIVATIVE_QUALITY[fmt], "exif": b""}
+        if icc_profile:
+            options["icc_profile"] = icc_profile
+        if fmt == "jpeg":
+            options.update(optimize=True, progressive=True)
+        elif fmt == "webp":
+            options["method"] = 6
+        tmp_path = temp_path_for(IMAGE_CACHE_DIR / out_name)
+        img.save(tmp_path, format=fmt.upper(), **options)
+        os.replace(tmp_path, IMAGE_CACHE_DIR / out_name)
+        outputs[fmt] = out_name
+    return outputs
+
+def get_image_derivatives(src_path, manifest):
+    """Return {format: Path} for one source image, rebuilding only when it changed.
+
+    The manifest entry is reused while the source mtime/size are unchanged; if
+    they moved, the bytes are re-hashed and derivatives are rebuilt only when
+    the content (or the derivative settings) actually differ.
+    """
+    stat = os.stat(src_path)
+    entry = manifest.get(str(src_path))
+
+    def outputs_present(e):
+        return (
+            e.get("params") == _DERIVATIVE_PARAMS
+            and all((IMAGE_CACHE_DIR / name).exists() for name in e["outputs"].values())
+        )
+
+    if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size and outputs_present(entry):
+        return {fmt: IMAGE_CACHE_DIR / name for fmt, name in entry["outputs"].items()}
+
+    with open(src_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    if not (entry and entry["sha256"] == digest and outputs_present(entry)):
+        IMAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        entry = {"sha256": digest, "params": _DERIVATIVE_PARAMS, "outputs": _render_derivatives(src_path, digest)}
+    entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+    manifest[str(src_path)] = entry
+    return {fmt: IMAGE_CACHE_DIR / name for fmt, name in entry["outputs"].items()}
+
+# 📦 Static asset mode — serve files from ./static via Streamlit's static route
+STATIC_CACHE_DIR = Path("static") / "cache"
+# Formats Streamlit's static handler serves with a proper image Content-Type
+STATIC_IMAGE_FORMATS = ("webp", "jpeg")
+_published_assets = {}
+
+def static_serving_enabled():
+    """True when server.enableStaticServing is on (see .streamlit/config.toml)."""
+    try:
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+def publish_static(file_path, digest=None):
+    """Expose a file under static/cache with a content-hashed name and return its URL.
+
+    The ``?v=`` query makes Tornado's static handler send a 10-year
+    Cache-Control, and the ETag turns any revalidation into a 304.
+    """
+    file_path = Path(file_path)
+    stat = file_path.stat()
+    cache_key = (str(file_path), stat.st_mtime_ns, stat.st_size, digest)
+    if cache_key in _published_assets:
+        return _published_assets[cache_key]
+
+    if digest is None:
+        digest = hashlib.sha256(file_path.read_bytes()).hexdigest()[:16]
+        name = f"{file_path.stem}-{digest}{file_path.suffix}"
+    else:
+        name = file_path.name  # derivatives are already content-addressed
+    target = STATIC_CACHE_DIR / name
+    if not target.exists():
+        STATIC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = temp_path_for(target)
+        try:
+            os.link(file_path, tmp_path)
+        except OSError:
+            tmp_path.write_bytes(file_path.read_bytes())
+        os.replace(tmp_path, target)
+
+    url = f"app/static/cache/{name}?v={digest}"
+    _published_assets[cache_key] = url
+    return url
+
+def image_src(file_path, mime="image/jpeg"):
+    """URL for an image: a cacheable static URL when enabled, else an inline data URI."""
+    if static_serving_enabled():
+        return publish_static(file_path)
+    b64 = base64.b64encode(Path(file_path).read_bytes()).decode()
+    return f"data:{mime};base64,{b64}"
+
+# 🧩 Utility — Slideshow-sized derivatives for all images in a folder
+@timed("load_images_from_folder")
+def load_images_from_folder(folder_path):
+    """Return one {format: src} dict per photo, ready for ``<picture>`` markup."""
+    with _derivative_lock:
+        manifest = _load_derivative_manifest()
+        before = json.dumps(manifest, sort_keys=True)
+        derivatives = [
+            get_image_derivatives(Path(folder_path) / filename, manifest)
+            for filename in sorted(os.listdir(folder_path))
+            if filename.lower().endswith((".jpg", ".jpeg", ".png"))
+        ]
+        if json.dumps(manifest, sort_keys=True) != before:
+            _save_derivative_manifest(manifest)
+
+    images = []
+    for outputs in derivatives:
+        if static_serving_enabled():
+            images.append({
+                fmt: publish_static(path, digest=path.name.split("-")[0])
+                for fmt, path in outputs.items()
+                if fmt in STATIC_IMAGE_FORMATS
+            })
+        else:
+            # Inline only the smallest broadly supported format (WebP), JPEG if unavailable
+            fmt = "webp" if "webp" in outputs else "jpeg"
+            b64 = base64.b64encode(outputs[fmt].read_bytes()).decode()
+            images.append({fmt: f"data:{DERIVATIVE_MIME[fmt]};base64,{b64}"})
+    return images
+
+# 🎨 Create FV logo PNG (Glowing Gradient Version) — cached, rebuilt only when its design changes
+FV_LOGO = {
+    "size": (256, 256),
+    "top_color": (0, 198, 255),
+    "bottom_color": (0, 114, 255),
+    "text": "FV",
+    "font": ("arialbd.ttf", 160),
+    "glow_radius": 8,
+}
+
+def _logo_params_hash(params):
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
+
+def _vertical_gradient(size, top_color, bottom_color):
+    """Top→bottom RGB gradient built with per-channel lookup tables (no per-row drawing)."""
+    from PIL import Image
+
+    ramp = Image.linear_gradient("L").resize(size)  # row y holds ~255·y/height
+    channels = [
+        ramp.point([int(top * (1 - v / 256) + bottom * (v / 256)) for v in range(256)])
+        for top, bottom in zip(top_color, bottom_color)
+    ]
+    return Image.merge("RGB", channels).convert("RGBA")
+
+@timed("create_fv_logo")
+@st.cache_resource(show_spinner=False)
+def create_fv_logo(cache_dir=CACHE_DIR):
+    """Build the page icon under .cache/ — the tracked favicon.png is never rewritten.
+
+    The file name carries the design hash, so a warm start is one ``exists()``
+    check and PIL is only imported when the logo actually has to be drawn.
+    """
+    params = dict(FV_LOGO)
+    logo_path = Path(cache_dir) / f"favicon-{_logo_params_hash(params)}.png"
+    if logo_path.exists():
+        return str(logo_path)
+
+    from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+    size = params["size"]
+    img = _vertical_gradient(size, params["top_color"], params["bottom_color"])
+    draw = ImageDraw.Draw(img)
+
+    # 🧠 Add FV text (centered)
+    try:
+        font = ImageFont.truetype(*params["font"])
+    except OSError:
+        font = ImageFont.load_default()
+
+    text = params["text"]
+    bbox = draw.textbbox((0, 0), text, font=font)
+    text_w, text_h = bbox[2] - bbox[0], bbox[3] - bbox[1]
+    text_pos = ((size[0] - text_w) / 2, (size[1] - text_h) / 2.5)
+    draw.text(text_pos, text, font=font, fill=(255, 255, 255, 255))
+
+    # ✨ Apply subtle glow
+    glow = img.filter(ImageFilter.GaussianBlur(params["glow_radius"]))
+    img = Image.alpha_composite(glow, img)
+
+    # Save atomically so concurrent sessions never read a half-written file
+    try:
+        logo_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = temp_path_for(logo_path)
+        img.save(tmp_path, format="PNG")
+        os.replace(tmp_path, logo_path)
+    except OSError:
+        return img  # read-only deploy — st.set_page_config accepts the image directly
+    return str(logo_path)
@@ -0,0 +1,44 @@
+# core/lazy.py — FarhunVerse | Deferred imports and background warm-up
+
+import os
+import threading
+
+import streamlit as st
+
+# -----------------------------------------------
+# 💤 LAZY IMPORTS — plotly already comes in with streamlit; PIL is imported inside core/images.py's
+# functions, so only streamlit_lottie (and the requests stack under it) needs a wrapper here
+# -----------------------------------------------
+def st_lottie(*args, **kwargs):
+    from streamlit_lottie import st_lottie as _st_lottie
+
+    return _st_lottie(*args, **kwargs)
+
+# Imported ahead of time (after the first page has rendered) so the navigator's first answer doesn't pay for them
+WARMUP_MODULES = (
+    "PyPDF2",
+    "faiss",
+    "langchain.text_splitter",
+    "langchain_community.vectorstores",
+    "langchain_openai",
+    "langchain.chains",
+    "langchain.memory",
+    "core.embeddings",
+    "core.retrieval",
+)
+
+@st.cache_resource(show_spinner=False)
+def start_import_warmup():
+    """Import WARMUP_MODULES on a background thread, once per process (FARHUNVERSE_WARMUP=0 disables)."""
+    import importlib
+
+    def warm():
+        for name in WARMUP_MODULES:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                pass  # the page that needs it will surface the real error
+
+    if os.getenv("FARHUNVERSE_WARMUP", "1") != "0":
+        threading.Thread(target=warm, name="import-warmup", daemon=True).start()
+    return True
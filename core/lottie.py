@@ -0,0 +1,278 @@
+# core/lottie.py — FarhunVerse | Offline-first Lottie animation cache
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import streamlit as st
+
+from core.perf import timed
+from core.settings import CACHE_DIR, temp_path_for
+
+# -----------------------------------------------
+# 🧠 LOTTIE HELPER (STABLE)
+# -----------------------------------------------
+LOTTIE_CACHE_DIR = CACHE_DIR / "lottie"
+
+# ✅ Verified, working Lottie JSONs
+LOTTIE_URLS = {
+    "ai": "https://assets10.lottiefiles.com/packages/lf20_1pxqjqps.json",       # futuristic AI circuit
+    "code": "https://assets9.lottiefiles.com/packages/lf20_qp1q7mct.json",      # coding animation
+    "connect": "https://assets1.lottiefiles.com/packages/lf20_jcikwtux.json",   # connection animation
+    "about": "https://assets9.lottiefiles.com/packages/lf20_w51pcehl.json",
+    "rocket": "https://assets2.lottiefiles.com/packages/lf20_x62chJ.json",
+}
+# Vendored copies of the same animations (python -m core.lottie), shown until the disk cache has a fresher one
+LOTTIE_ASSET_DIR = Path("assets") / "lottie"
+LOTTIE_FALLBACKS = {url: str(LOTTIE_ASSET_DIR / f"{name}.json") for name, url in LOTTIE_URLS.items()}
+LOTTIE_TIMEOUT = (2, 5)  # (connect, read) seconds
+LOTTIE_OFFLINE = os.getenv("LOTTIE_OFFLINE") == "1"
+# Keys the player never reads (editor names/classes); only dropped when the file has no expressions
+LOTTIE_UNUSED_KEYS = {"nm", "mn", "cl", "ln"}
+
+def minify_lottie(node, precision=3, strip_names=True):
+    """Round floats and drop editor-only keys — a smaller, faster-to-parse animation."""
+    if isinstance(node, dict):
+        return {
+            k: minify_lottie(v, precision, strip_names)
+            for k, v in node.items()
+            if not (strip_names and k in LOTTIE_UNUSED_KEYS)
+        }
+    if isinstance(node, list):
+        return [minify_lottie(v, precision, strip_names) for v in node]
+    if isinstance(node, float):
+        rounded = round(node, precision)
+        return int(rounded) if rounded.is_integer() else rounded
+    return node
+
+def _has_expressions(node):
+    # Expressions ("x" holding JS source) may look layers up by name — keep "nm" then
+    if isinstance(node, dict):
+        return isinstance(node.get("x"), str) or any(_has_expressions(v) for v in node.values())
+    if isinstance(node, list):
+        return any(_has_expressions(v) for v in node)
+    return False
+
+class LottieCache:
+    """Bounded LRU of parsed Lottie animations, shared by every session.
+
+    Local files are keyed by path + mtime. URLs are offline-first: the last
+    copy on disk (or a bundled fallback) is returned immediately and, once
+    stale, refreshed in a background thread with an ETag-conditional request —
+    so a rerun never waits on the network.
+    """
+
+    def __init__(self, max_entries=32, minify=False, revalidate_after=3600, retry_failed_after=60,
+                 offline=False, max_workers=4):
+        from collections import OrderedDict
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.max_entries = max_entries
+        self.minify = minify
+        self.revalidate_after = revalidate_after
+        self.retry_failed_after = retry_failed_after
+        self.offline = offline
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lottie-fetch")
+        self._session = None  # created by the first background refresh
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _parse(self, raw, source_id):
+        """Parse JSON bytes, going through the on-disk minified copy when enabled."""
+        if not self.minify:
+            return json.loads(raw)
+        min_path = LOTTIE_CACHE_DIR / f"{hashlib.sha256(source_id.encode() + raw).hexdigest()[:16]}.json"
+        try:
+            with open(min_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+        data = json.loads(raw)
+        data = minify_lottie(data, strip_names=not _has_expressions(data))
+        LOTTIE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = temp_path_for(min_path)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, min_path)
+        return data
+
+    def get_file(self, file_path):
+        stat = os.stat(file_path)
+        key = ("file", str(file_path))
+        entry = self._get(key)
+        if entry and entry["version"] == (stat.st_mtime_ns, stat.st_size):
+            return entry["data"]
+        with open(file_path, "rb") as f:
+            data = self._parse(f.read(), str(file_path))
+        self._put(key, {"version": (stat.st_mtime_ns, stat.st_size), "data": data})
+        return data
+
+    # --- Remote animations (stale-while-revalidate) ---
+    @staticmethod
+    def _url_paths(url):
+        stem = f"url-{hashlib.sha256(url.encode()).hexdigest()[:16]}"
+        return LOTTIE_CACHE_DIR / f"{stem}.json", LOTTIE_CACHE_DIR / f"{stem}.meta.json"
+
+    def _load_url_from_disk(self, url):
+        body_path, meta_path = self._url_paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                data = self._parse(f.read(), url)
+        except (OSError, ValueError):
+            return None
+        return {"data": data, "etag": meta.get("etag"), "checked_at": meta.get("checked_at", 0), "ok": True}
+
+    def _save_url_to_disk(self, url, raw, etag, checked_at):
+        body_path, meta_path = self._url_paths(url)
+        LOTTIE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        if raw is not None:
+            tmp_path = temp_path_for(body_path)
+            tmp_path.write_bytes(raw)
+            os.replace(tmp_path, body_path)
+        tmp_path = temp_path_for(meta_path)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"url": url, "etag": etag, "checked_at": checked_at}, f)
+        os.replace(tmp_path, meta_path)
+
+    def _fallback_entry(self, url):
+        fallback = LOTTIE_FALLBACKS.get(url)
+        data = self.get_file(fallback) if fallback and os.path.exists(fallback) else None
+        return {"data": data, "etag": None, "checked_at": 0, "ok": False}
+
+    def get_url(self, url):
+        """Return the freshest copy available right now; refresh in the background if stale."""
+        key = ("url", url)
+        entry = self._get(key)
+        if entry is None:
+            entry = self._load_url_from_disk(url) or self._fallback_entry(url)
+            self._put(key, entry)
+        max_age = self.revalidate_after if entry["ok"] else self.retry_failed_after
+        if time.time() - entry["checked_at"] > max_age:
+            self.refresh_async(url)
+        return entry["data"]
+
+    def refresh_async(self, url):
+        if self.offline:
+            return
+        with self._lock:
+            if url in self._refreshing:
+                return
+            self._refreshing.add(url)
+        self._pool.submit(self._refresh, url)
+
+    def _refresh(self, url):
+        key = ("url", url)
+        try:
+            entry = self._get(key) or self._fallback_entry(url)
+            import requests
+
+            if self._session is None:
+                self._session = requests.Session()
+            headers = {"If-None-Match": entry["etag"]} if entry["etag"] else {}
+            now = time.time()
+            try:
+                res = self._session.get(url, headers=headers, timeout=LOTTIE_TIMEOUT)
+            except requests.RequestException:
+                self._put(key, dict(entry, checked_at=now))  # keep serving what we have
+                return
+            if res.status_code == 304 and entry["ok"]:
+                self._put(key, dict(entry, checked_at=now))
+                self._save_url_to_disk(url, None, entry["etag"], now)
+            elif res.status_code == 200:
+                data = self._parse(res.content, url)
+                etag = res.headers.get("ETag")
+                self._put(key, {"data": data, "etag": etag, "checked_at": now, "ok": True})
+                self._save_url_to_disk(url, res.content, etag, now)
+            else:
+                self._put(key, dict(entry, checked_at=now))
+        except Exception:
+            pass  # a failed refresh must never surface in a page render
+        finally:
+            with self._lock:
+                self._refreshing.discard(url)
+
+    def prefetch(self, urls):
+        """Warm every URL concurrently (disk copy now, network refresh in the pool)."""
+        for url in urls:
+            self.get_url(url)
+
+@st.cache_resource(show_spinner=False)
+def get_lottie_cache():
+    """Process-wide Lottie cache (LOTTIE_MINIFY=1 stores minified copies, LOTTIE_OFFLINE=1 never fetches)."""
+    cache = LottieCache(minify=os.getenv("LOTTIE_MINIFY") == "1", offline=LOTTIE_OFFLINE)
+    cache.prefetch(LOTTIE_URLS.values())
+    return cache
+
+@timed("load_lottie_url")
+def load_lottie_url(url: str):
+    """Load a Lottie animation from a URL and return a dict (or None)."""
+    try:
+        data = get_lottie_cache().get_url(url)
+        if data is None:
+            st.warning(f"⚠️ Could not load Lottie: {url}")
+        return data
+    except Exception as e:
+        st.error(f"Lottie load error: {e}")
+        return None
+
+@timed("load_lottie_file")
+def load_lottie_file(file_path: str):
+    """Load a Lottie animation from a local JSON file."""
+    try:
+        if not os.path.exists(file_path):
+            st.warning(f"⚠️ Lottie file not found: {file_path}")
+            return None
+        return get_lottie_cache().get_file(file_path)
+    except Exception as e:
+        st.error(f"❌ Failed to load Lottie file {file_path}: {e}")
+        return None
+
+# -----------------------------------------------
+# 📦 VENDORING — python -m core.lottie refreshes assets/lottie/ from LOTTIE_URLS
+# -----------------------------------------------
+def vendor_lottie_fallbacks():
+    """Download every LOTTIE_URLS animation into its LOTTIE_FALLBACKS path; returns the names that failed."""
+    import requests
+
+    failed = []
+    LOTTIE_ASSET_DIR.mkdir(parents=True, exist_ok=True)
+    for name, url in LOTTIE_URLS.items():
+        try:
+            res = requests.get(url, timeout=LOTTIE_TIMEOUT)
+            res.raise_for_status()
+            if "layers" not in res.json():
+                raise ValueError("not a Lottie animation")
+        except (requests.RequestException, ValueError) as e:
+            print(f"{name}: {url} — {e}")
+            failed.append(name)
+            continue
+        path = Path(LOTTIE_FALLBACKS[url])
+        tmp_path = temp_path_for(path)
+        tmp_path.write_bytes(res.content)
+        os.replace(tmp_path, path)
+        print(f"{name}: {path} ({len(res.content) / 1024:.1f} KB)")
+    return failed
+
+if __name__ == "__main__":
+    sys.exit(1 if vendor_lottie_fallbacks() else 0)
@@ -0,0 +1,236 @@
+# core/mailer.py — FarhunVerse | Durable outbox + background SMTP delivery for the contact form
+
+import logging
+import os
+import random
+import smtplib
+import sqlite3
+import threading
+import time
+from email import policy
+from email.parser import BytesParser
+from pathlib import Path
+
+import streamlit as st
+
+# -----------------------------------------------
+# ✉️ SMTP SETTINGS — defaults match Gmail; point them at a local stand-in server to test
+# -----------------------------------------------
+SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "465"))
+SMTP_SECURITY = os.getenv("SMTP_SECURITY", "ssl").lower()  # ssl | starttls | plain
+SMTP_TIMEOUT = 20
+SMTP_IDLE_TIMEOUT = 60  # close the pooled connection after this long without mail
+EMAIL_USER = os.getenv("EMAIL_USER")
+EMAIL_PASS = os.getenv("EMAIL_PASS")
+
+OUTBOX_DB = Path("mail_outbox.db")
+MAX_ATTEMPTS = 8
+RETRY_BASE = 5  # seconds; doubles per attempt, capped at RETRY_MAX
+RETRY_MAX = 3600
+CLAIM_TIMEOUT = 600  # a 'sending' row older than this belongs to a crashed worker
+
+logger = logging.getLogger(__name__)
+
+def smtp_configured():
+    """Credentials are required unless the server is a plain (local/relay) one."""
+    return SMTP_SECURITY == "plain" or bool(EMAIL_USER and EMAIL_PASS)
+
+def _is_config_error(error):
+    """Login refused or required (530): fixable by the operator, so the message is kept and retried."""
+    if isinstance(error, smtplib.SMTPAuthenticationError):
+        return True
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code == 530
+
+class MailOutbox:
+    """SQLite (WAL) outbox drained by one background worker over a reused SMTP connection.
+
+    ``enqueue`` only inserts a row, so the contact form returns at once.
+    The worker claims due rows in a write transaction (safe with several
+    replicas on one host), sends them, deletes them on success and
+    reschedules them with exponential backoff + jitter on failure. Rows
+    rejected permanently (5xx other than 530/auth) or out of attempts are
+    kept as ``dead``; every failure is logged.
+    """
+
+    def __init__(self, db_path, batch_size=20):
+        self.batch_size = batch_size
+        self._conn = sqlite3.connect(str(db_path), timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS outbox ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " message BLOB NOT NULL,"
+            " status TEXT NOT NULL DEFAULT 'pending',"  # pending | sending | dead
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " next_attempt REAL NOT NULL,"
+            " claimed_at REAL,"
+            " last_error TEXT)"
+        )
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._smtp = None
+        self._smtp_used_at = 0.0
+        self._worker = threading.Thread(target=self._run, name="mail-outbox", daemon=True)
+        self._worker.start()
+
+    def enqueue(self, msg):
+        """Persist an ``EmailMessage`` for delivery; returns its outbox id."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO outbox (message, next_attempt) VALUES (?, ?)", (msg.as_bytes(), time.time())
+            )
+        self._wake.set()
+        return cursor.lastrowid
+
+    def pending_count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM outbox WHERE status != 'dead'").fetchone()[0]
+
+    # --- worker ---
+    def _claim(self):
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "UPDATE outbox SET status = 'pending' WHERE status = 'sending' AND claimed_at < ?",
+                    (now - CLAIM_TIMEOUT,),
+                )
+                rows = self._conn.execute(
+                    "SELECT id, message, attempts FROM outbox WHERE status = 'pending' AND next_attempt <= ? "
+                    "ORDER BY id LIMIT ?",
+                    (now, self.batch_size),
+                ).fetchall()
+                self._conn.executemany(
+                    "UPDATE outbox SET status = 'sending', claimed_at = ? WHERE id = ?",
+                    [(now, row[0]) for row in rows],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return rows
+
+    def _next_due_in(self):
+        with self._lock:
+            row = self._conn.execute("SELECT MIN(next_attempt) FROM outbox WHERE status = 'pending'").fetchone()
+        return None if row[0] is None else max(0.0, row[0] - time.time())
+
+    def _connection(self):
+        if self._smtp is not None:
+            try:
+                if time.monotonic() - self._smtp_used_at < SMTP_IDLE_TIMEOUT and self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close()
+        if SMTP_SECURITY == "ssl":
+            smtp = smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT, timeout=SMTP_TIMEOUT)
+        else:
+            smtp = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=SMTP_TIMEOUT)
+        try:
+            if SMTP_SECURITY == "starttls":
+                smtp.starttls()
+            if EMAIL_USER and EMAIL_PASS:
+                smtp.login(EMAIL_USER, EMAIL_PASS)
+        except BaseException:
+            smtp.close()  # not pooled yet — don't leak the socket
+            raise
+        self._smtp = smtp
+        self._smtp_used_at = time.monotonic()
+        return smtp
+
+    def _close(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp = None
+
+    def _deliver(self, rows):
+        parser = BytesParser(policy=policy.default)
+        for outbox_id, message, attempts in rows:
+            try:
+                self._connection().send_message(parser.parsebytes(message))
+                self._smtp_used_at = time.monotonic()
+            except (smtplib.SMTPException, OSError) as e:
+                if not isinstance(e, (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused)):
+                    self._close()  # transport error — reconnect for the next message
+                self._fail(outbox_id, attempts + 1, e)
+                continue
+            except Exception as e:
+                # Malformed message (ValueError, UnicodeEncodeError, ...) or an smtplib bug — not this worker's end
+                logger.exception("Outbox mail #%d raised unexpectedly", outbox_id)
+                self._close()
+                self._fail(outbox_id, attempts + 1, e)
+                continue
+            with self._lock:
+                self._conn.execute("DELETE FROM outbox WHERE id = ?", (outbox_id,))
+
+    def _fail(self, outbox_id, attempts, error):
+        permanent = isinstance(error, smtplib.SMTPResponseException) and error.smtp_code >= 500
+        permanent = permanent or isinstance(error, smtplib.SMTPRecipientsRefused)
+        permanent = permanent and not _is_config_error(error)  # config, not the message
+        status = "dead" if permanent or attempts >= MAX_ATTEMPTS else "pending"
+        delay = min(RETRY_BASE * 2 ** (attempts - 1), RETRY_MAX) * random.uniform(0.8, 1.2)
+        if status == "dead":
+            logger.error("Outbox mail #%d dropped after %d attempt(s): %r", outbox_id, attempts, error)
+        else:
+            logger.warning(
+                "Outbox mail #%d failed (attempt %d/%d), retrying in %.0fs: %r",
+                outbox_id, attempts, MAX_ATTEMPTS, delay, error,
+            )
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, next_attempt = ?, last_error = ? WHERE id = ?",
+                (status, attempts, time.time() + delay, repr(error)[:500], outbox_id),
+            )
+
+    def _release(self, rows, error):
+        """Back off claimed rows still marked 'sending' after the worker loop itself failed."""
+        with self._lock:
+            still_claimed = {
+                row[0] for row in self._conn.execute(
+                    f"SELECT id FROM outbox WHERE status = 'sending' AND id IN ({','.join('?' * len(rows))})",
+                    [row[0] for row in rows],
+                )
+            }
+        for outbox_id, _, attempts in rows:
+            if outbox_id in still_claimed:
+                self._fail(outbox_id, attempts + 1, error)
+
+    def _run(self):
+        while True:
+            rows = []
+            try:
+                rows = self._claim()
+                if rows:
+                    self._deliver(rows)
+                    continue
+                due_in = self._next_due_in()
+            except sqlite3.Error as e:
+                logger.warning("Outbox database unavailable: %r", e)
+                due_in = RETRY_BASE  # DB busy/locked — try again shortly
+            except Exception as e:
+                # Never let the only worker die: log, back off what it had claimed, keep looping
+                logger.exception("Outbox worker iteration failed")
+                self._close()
+                if rows:
+                    try:
+                        self._release(rows, e)
+                    except Exception:
+                        logger.exception("Could not release %d claimed outbox mail(s)", len(rows))
+                due_in = RETRY_BASE
+            if self._smtp is not None and time.monotonic() - self._smtp_used_at >= SMTP_IDLE_TIMEOUT:
+                self._close()
+            timeout = SMTP_IDLE_TIMEOUT if due_in is None else min(due_in, SMTP_IDLE_TIMEOUT)
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+@st.cache_resource(show_spinner=False)
+def get_mail_outbox():
+    """Process-wide outbox; its worker also picks up mail left over from previous runs."""
+    return MailOutbox(OUTBOX_DB)
@@ -0,0 +1,131 @@
+# core/pdftext.py — FarhunVerse | Per-page PDF text extraction with an incremental sidecar cache
+#
+# Kept free of Streamlit imports: pool workers are spawned processes that import
+# only this module.
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# 🗂️ Sidecar cache: .cache/pdf_text/<pdf name>.json (CACHE_DIR, spelled out to keep core.settings out of workers)
+PDF_TEXT_CACHE_DIR = Path(".cache") / "pdf_text"
+PDF_TEXT_FORMAT = 2  # 2: page hashes no longer depend on the reader instance
+# Below this many changed pages, extraction stays in-process (spawning costs more than it saves)
+PDF_POOL_MIN_PAGES = 8
+PDF_POOL_WORKERS = min(4, os.cpu_count() or 1)
+
+def _hash_object(digest, obj, seen):
+    """Feed a PDF object into ``digest`` by value — indirect references are resolved, streams hashed by their data."""
+    from PyPDF2.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+
+    if isinstance(obj, IndirectObject):
+        ref = (obj.idnum, obj.generation)
+        if ref in seen:
+            # Shared or cyclic object, already hashed — refer to it by visit order, not object number
+            digest.update(f"R{seen[ref]}".encode())
+            return
+        seen[ref] = len(seen)
+        obj = obj.get_object()
+    if isinstance(obj, StreamObject):
+        digest.update(b"stream")
+        digest.update(obj.get_data())
+    if isinstance(obj, DictionaryObject):
+        digest.update(b"<<")
+        for key in sorted(obj):
+            digest.update(str(key).encode())
+            _hash_object(digest, obj.raw_get(key), seen)
+        digest.update(b">>")
+    elif isinstance(obj, ArrayObject):
+        digest.update(b"[")
+        for item in obj:
+            _hash_object(digest, item, seen)
+        digest.update(b"]")
+    else:
+        digest.update(repr(obj).encode())
+
+def _page_hash(page):
+    """Hash of what extract_text reads: the page's content stream and its resources.
+
+    Built from object values, never their repr — PyPDF2's IndirectObject repr
+    includes the reader's id(), which would make every reopen look changed.
+    """
+    digest = hashlib.sha256()
+    contents = page.get_contents()
+    digest.update(contents.get_data() if contents is not None else b"")
+    _hash_object(digest, page.raw_get("/Resources") if "/Resources" in page else None, {})
+    return digest.hexdigest()
+
+def _extract_pages(pdf_path, page_numbers):
+    """Pool worker: text of ``page_numbers`` (0-based) in ``pdf_path``."""
+    from PyPDF2 import PdfReader
+
+    reader = PdfReader(pdf_path)
+    return [reader.pages[n].extract_text() or "" for n in page_numbers]
+
+def _sidecar_path(pdf_path):
+    return PDF_TEXT_CACHE_DIR / f"{Path(pdf_path).name}.json"
+
+def _load_sidecar(pdf_path):
+    try:
+        with open(_sidecar_path(pdf_path), "r", encoding="utf-8") as f:
+            sidecar = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return sidecar if sidecar.get("format") == PDF_TEXT_FORMAT else None
+
+def _save_sidecar(pdf_path, sidecar):
+    from core.settings import temp_path_for
+
+    path = _sidecar_path(pdf_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = temp_path_for(path)
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(sidecar, f)
+    os.replace(tmp_path, path)
+
+def extract_pdf_pages(pdf_path):
+    """Text of every page of ``pdf_path``, re-extracting only pages whose content changed.
+
+    An unchanged file (same SHA-256) is served from the sidecar without
+    parsing the PDF. Otherwise pages are matched by content hash, so an
+    edit to one page re-extracts just that page; many changed pages are
+    spread over a process pool.
+    """
+    from PyPDF2 import PdfReader
+
+    file_hash = hashlib.sha256(Path(pdf_path).read_bytes()).hexdigest()
+    sidecar = _load_sidecar(pdf_path)
+    if sidecar and sidecar["file_hash"] == file_hash:
+        return [page["text"] for page in sidecar["pages"]]
+
+    known = {page["hash"]: page["text"] for page in (sidecar or {}).get("pages", [])}
+    reader = PdfReader(pdf_path)
+    hashes = [_page_hash(page) for page in reader.pages]
+    texts = [known.get(h) for h in hashes]
+    stale = [n for n, text in enumerate(texts) if text is None]
+
+    if len(stale) >= PDF_POOL_MIN_PAGES and PDF_POOL_WORKERS > 1:
+        import multiprocessing
+        from concurrent.futures.process import BrokenProcessPool
+
+        batches = [stale[i::PDF_POOL_WORKERS] for i in range(PDF_POOL_WORKERS)]
+        try:
+            # spawn, not fork — forking a threaded server process can deadlock
+            with ProcessPoolExecutor(PDF_POOL_WORKERS, mp_context=multiprocessing.get_context("spawn")) as pool:
+                for batch, extracted in zip(batches, pool.map(_extract_pages, [str(pdf_path)] * len(batches), batches)):
+                    for n, text in zip(batch, extracted):
+                        texts[n] = text
+        except (BrokenProcessPool, OSError):
+            pass  # no worker processes available — the pages left unset are extracted below
+    for n in stale:
+        if texts[n] is None:
+            texts[n] = reader.pages[n].extract_text() or ""
+
+    _save_sidecar(pdf_path, {
+        "format": PDF_TEXT_FORMAT,
+        "file_hash": file_hash,
+        "pages": [{"hash": h, "text": text} for h, text in zip(hashes, texts)],
+    })
+    return texts
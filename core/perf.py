@@ -0,0 +1,234 @@
+# core/perf.py — FarhunVerse | Span timing, per-rerun payload accounting and a debug panel
+#
+# Off unless FARHUNVERSE_PERF=1: `timed` then returns functions untouched and
+# `span` is a shared no-op, so the instrumentation costs nothing in production.
+#
+#   FARHUNVERSE_PERF=1 streamlit run app.py          # record + show the sidebar panel
+#   python -m core.perf .cache/perf.jsonl            # p50/p95 per span from the log
+
+import contextlib
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+
+import streamlit as st
+
+PERF_ENABLED = os.getenv("FARHUNVERSE_PERF", "0") == "1"
+PERF_LOG = Path(os.getenv("FARHUNVERSE_PERF_LOG", ".cache/perf.jsonl"))
+PERF_WINDOW = 500  # recent samples kept per span for the live p50/p95
+
+_local = threading.local()
+_local_traces = {}  # session id -> trace of its running script (for payload accounting)
+_NOOP = contextlib.nullcontext()
+
+# -----------------------------------------------
+# 🧾 TRACE — spans + payload of one script run
+# -----------------------------------------------
+class RerunTrace:
+    def __init__(self):
+        self.page = None
+        self.started = time.perf_counter()
+        self.ts = time.time()
+        self.spans = []  # (name, ms, thread name)
+        self.payload = defaultdict(int)  # element type -> bytes sent to the browser
+        self._lock = threading.Lock()
+
+    def add_span(self, name, ms):
+        with self._lock:
+            self.spans.append((name, ms, threading.current_thread().name))
+
+    def add_payload(self, kind, size):
+        with self._lock:
+            self.payload[kind] += size
+
+    def to_record(self):
+        with self._lock:
+            return {
+                "ts": round(self.ts, 3),
+                "page": self.page,
+                "total_ms": round((time.perf_counter() - self.started) * 1000, 2),
+                "payload_bytes": sum(self.payload.values()),
+                "payload": dict(self.payload),
+                "spans": [{"name": n, "ms": round(ms, 3), "thread": t} for n, ms, t in self.spans],
+            }
+
+def current_trace():
+    return getattr(_local, "trace", None)
+
+def bind_thread(trace):
+    """Attribute spans recorded on this (helper) thread to ``trace``."""
+    _local.trace = trace
+
+# -----------------------------------------------
+# ⏱️ SPANS
+# -----------------------------------------------
+@contextlib.contextmanager
+def _span(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        ms = (time.perf_counter() - start) * 1000
+        get_perf_stats().add(name, ms)
+        trace = current_trace()
+        if trace is not None:
+            trace.add_span(name, ms)
+
+def span(name):
+    """``with span("faiss_search"): ...`` — a no-op unless FARHUNVERSE_PERF=1."""
+    return _span(name) if PERF_ENABLED else _NOOP
+
+def timed(name):
+    """Decorator form of ``span``; keeps st.cache_* helpers such as ``.clear()`` reachable."""
+    def decorate(fn):
+        if not PERF_ENABLED:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with _span(name):
+                return fn(*args, **kwargs)
+
+        if hasattr(fn, "clear"):
+            wrapper.clear = fn.clear
+        return wrapper
+    return decorate
+
+# -----------------------------------------------
+# 📈 AGGREGATES — rolling p50/p95 per span + the JSON-lines log
+# -----------------------------------------------
+def percentile(values, q):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * q
+    lo, hi = int(rank), min(int(rank) + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (rank - lo)
+
+class PerfStats:
+    def __init__(self, log_path, window=PERF_WINDOW):
+        self.log_path = Path(log_path)
+        self.window = window
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))
+        self._lock = threading.Lock()
+
+    def add(self, name, ms):
+        with self._lock:
+            self._samples[name].append(ms)
+
+    def summary(self):
+        """``{span: {"n", "p50", "p95"}}`` over the recent window."""
+        with self._lock:
+            samples = {name: list(values) for name, values in self._samples.items()}
+        return {
+            name: {"n": len(v), "p50": percentile(v, 0.5), "p95": percentile(v, 0.95)}
+            for name, v in sorted(samples.items())
+        }
+
+    def log(self, record):
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            try:
+                self.log_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(line)
+            except OSError:
+                pass  # timing is best-effort; never break a page over it
+
+@st.cache_resource(show_spinner=False)
+def get_perf_stats():
+    return PerfStats(PERF_LOG)
+
+# -----------------------------------------------
+# 🔁 RERUN HOOKS — called from app.py around page.run()
+# -----------------------------------------------
+def _count_payload(ctx):
+    """Wrap the session's enqueue once so every ForwardMsg is sized into the active trace."""
+    if getattr(ctx, "_perf_counted", False):
+        return
+    enqueue = ctx._enqueue
+
+    def counting_enqueue(msg):
+        trace = _local_traces.get(ctx.session_id)
+        if trace is not None:
+            kind = msg.WhichOneof("type") or "other"
+            if kind == "delta":
+                kind = msg.delta.new_element.WhichOneof("type") or msg.delta.WhichOneof("type") or "delta"
+            trace.add_payload(kind, msg.ByteSize())
+        enqueue(msg)
+
+    ctx._enqueue = counting_enqueue
+    ctx._perf_counted = True
+
+def begin_rerun():
+    if not PERF_ENABLED:
+        return
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    trace = RerunTrace()
+    bind_thread(trace)
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        _local_traces[ctx.session_id] = trace
+        _count_payload(ctx)
+
+def end_rerun(page):
+    """Close the run's trace, append it to the log and return it (None when disabled)."""
+    trace = current_trace()
+    if not PERF_ENABLED or trace is None:
+        return None
+    trace.page = page
+    bind_thread(None)
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        _local_traces.pop(ctx.session_id, None)
+    record = trace.to_record()
+    get_perf_stats().add("rerun", record["total_ms"])
+    get_perf_stats().log(record)
+    return record
+
+def render_perf_panel(record):
+    """Hidden sidebar panel: this run's spans + payload, and rolling p50/p95 per span."""
+    if record is None:
+        return
+    with st.sidebar.expander(f"⏱️ Perf — {record['total_ms']:.0f} ms, {record['payload_bytes'] / 1024:.1f} KB"):
+        rows = [f"| {s['name']} | {s['ms']:.1f} |" for s in record["spans"]]
+        st.markdown("**This run**\n\n| span | ms |\n|---|---:|\n" + "\n".join(rows or ["| — | — |"]))
+        payload = sorted(record["payload"].items(), key=lambda item: -item[1])
+        st.markdown("**Payload**\n\n| element | bytes |\n|---|---:|\n" + "\n".join(f"| {k} | {v:,} |" for k, v in payload))
+        summary = get_perf_stats().summary()
+        st.markdown(
+            "**Recent (p50 / p95 ms)**\n\n| span | n | p50 | p95 |\n|---|---:|---:|---:|\n"
+            + "\n".join(f"| {name} | {s['n']} | {s['p50']:.1f} | {s['p95']:.1f} |" for name, s in summary.items())
+        )
+
+# -----------------------------------------------
+# 🧮 OFFLINE SUMMARY — python -m core.perf [log]
+# -----------------------------------------------
+def summarize_log(path):
+    samples = defaultdict(list)
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            samples[f"rerun:{record.get('page')}"].append(record["total_ms"])
+            samples["payload_kb"].append(record["payload_bytes"] / 1024)
+            for s in record["spans"]:
+                samples[s["name"]].append(s["ms"])
+    return {name: {"n": len(v), "p50": percentile(v, 0.5), "p95": percentile(v, 0.95)} for name, v in sorted(samples.items())}
+
+if __name__ == "__main__":
+    summary = summarize_log(sys.argv[1] if len(sys.argv) > 1 else PERF_LOG)
+    width = max((len(name) for name in summary), default=4)
+    print(f"{'span':<{width}}  {'n':>6}  {'p50':>9}  {'p95':>9}")
+    for name, s in summary.items():
+        print(f"{name:<{width}}  {s['n']:>6}  {s['p50']:>9.2f}  {s['p95']:>9.2f}")
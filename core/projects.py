@@ -0,0 +1,123 @@
+# core/projects.py — FarhunVerse | Project catalog: validated data file + precomputed category index
+
+import html
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import streamlit as st
+
+PROJECTS_FILE = Path("data/projects.json")
+CATEGORIES = ["All", "AI/ML", "Blockchain", "Data Science"]
+LINK_LABELS = {
+    "demo": "▶ Live Demo",
+    "github": "💻 GitHub",
+    "video": "🎬 Video",
+    "hackathon": "🏁 Hackathon",
+}
+
+def categorize_project(title, description, stack):
+    text = f"{title} {description} {stack}".lower()
+    if "eduregion" in text or "guardianai" in text:
+        return ["AI/ML", "Data Science"]
+    elif "blockchain" in text or "near" in text or "rootstock" in text or "celo" in text:
+        return ["Blockchain"]
+    elif "ai" in text or "ml" in text or "langchain" in text:
+        return ["AI/ML"]
+    elif "data" in text or "pandas" in text or "analysis" in text:
+        return ["Data Science"]
+    return ["General"]
+
+@dataclass(frozen=True)
+class Project:
+    title: str
+    description: str
+    stack: tuple
+    links: dict = field(default_factory=dict)
+    lottie: str = None
+    categories: tuple = ()
+    card_body: str = ""  # pre-rendered inner HTML of the project card
+
+    def card_html(self, side=""):
+        return f"<div class='project-card {side}'>{self.card_body}</div>"
+
+@dataclass(frozen=True)
+class ProjectCatalog:
+    projects: tuple
+    by_category: dict  # category -> tuple of projects, in file order ("All" included)
+
+    def filter(self, category):
+        return self.by_category.get(category, ())
+
+def _render_card_body(title, description, stack, links):
+    stack_tags = " ".join(f"<span class='stack-badge'>{html.escape(tag)}</span>" for tag in stack)
+    link_tags = " ".join(
+        f"<a href='{html.escape(links[kind])}' target='_blank'>{label}</a>"
+        for kind, label in LINK_LABELS.items() if links.get(kind)
+    )
+    return (
+        f"<h3>{html.escape(title)}</h3>"
+        f"<p>{html.escape(description, quote=False)}</p>"
+        f"<div>{stack_tags}</div>"
+        f"<div class='proj-links'>{link_tags}</div>"
+    )
+
+def _validate(raw, position, source):
+    where = f"{source}: project #{position + 1}"
+    if not isinstance(raw, dict):
+        raise ValueError(f"{where} must be an object")
+    unknown = set(raw) - {"title", "description", "stack", "lottie", "links", "categories"}
+    if unknown:
+        raise ValueError(f"{where} has unknown field(s): {', '.join(sorted(unknown))}")
+    for name in ("title", "description"):
+        if not isinstance(raw.get(name), str) or not raw[name].strip():
+            raise ValueError(f"{where} needs a non-empty '{name}'")
+    stack = raw.get("stack", [])
+    if not isinstance(stack, list) or not all(isinstance(tag, str) and tag.strip() for tag in stack):
+        raise ValueError(f"{where} ('{raw['title']}'): 'stack' must be a list of non-empty strings")
+    links = raw.get("links", {})
+    if not isinstance(links, dict) or set(links) - set(LINK_LABELS):
+        raise ValueError(f"{where} ('{raw['title']}'): 'links' keys must be among {', '.join(LINK_LABELS)}")
+    for kind, url in links.items():
+        if not isinstance(url, str) or not url.startswith(("https://", "http://")):
+            raise ValueError(f"{where} ('{raw['title']}'): link '{kind}' must be an http(s) URL")
+    lottie = raw.get("lottie")
+    if lottie is not None and not Path(lottie).is_file():
+        raise ValueError(f"{where} ('{raw['title']}'): lottie file '{lottie}' not found")
+    categories = raw.get("categories")
+    if categories is not None and (not isinstance(categories, list) or not set(categories) <= set(CATEGORIES[1:])):
+        raise ValueError(f"{where} ('{raw['title']}'): 'categories' must be among {', '.join(CATEGORIES[1:])}")
+
+def load_project_catalog(path=PROJECTS_FILE):
+    """Parse + validate the project file and precompute categories, card HTML and the category index."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    projects = []
+    for position, raw in enumerate(data.get("projects", [])):
+        _validate(raw, position, path)
+        stack = tuple(tag.strip() for tag in raw.get("stack", []))
+        links = dict(raw.get("links", {}))
+        categories = raw.get("categories") or categorize_project(raw["title"], raw["description"], ", ".join(stack))
+        projects.append(Project(
+            title=raw["title"],
+            description=raw["description"],
+            stack=stack,
+            links=links,
+            lottie=raw.get("lottie"),
+            categories=tuple(categories),
+            card_body=_render_card_body(raw["title"], raw["description"], stack, links),
+        ))
+    by_category = {category: [] for category in CATEGORIES}
+    for project in projects:
+        by_category["All"].append(project)
+        for category in project.categories:
+            by_category.setdefault(category, []).append(project)
+    return ProjectCatalog(tuple(projects), {c: tuple(ps) for c, ps in by_category.items()})
+
+@st.cache_resource(show_spinner=False)
+def _cached_catalog(path, mtime_ns):
+    return load_project_catalog(Path(path))
+
+def get_project_catalog(path=PROJECTS_FILE):
+    """Process-wide catalog; editing the data file reloads it on the next rerun."""
+    return _cached_catalog(str(path), Path(path).stat().st_mtime_ns)
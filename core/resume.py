@@ -0,0 +1,131 @@
+# core/resume.py — FarhunVerse | Resume text, FAISS index and keyword search
+
+import functools
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import streamlit as st
+
+from core.data import RESUME_PATH
+from core.perf import timed
+from core.settings import CACHE_DIR, temp_path_for
+
+# 🗂️ Persisted FAISS index for the resume
+INDEX_CACHE_DIR = CACHE_DIR / "resume_index"
+
+# Inputs that shape the resume index — any change (incl. the embedding model) rebuilds it
+INDEX_FORMAT = 2  # 2: chunks split per page, with page/start_index metadata
+CHUNK_SIZE = 800
+CHUNK_OVERLAP = 200
+
+# -----------------------------------------------
+# ⚙️ UTILITIES
+# -----------------------------------------------
+def get_pdf_pages(pdf_path):
+    """Per-page text, served from the sidecar cache in .cache/pdf_text when unchanged."""
+    if not Path(pdf_path).exists():
+        return []
+    from core.pdftext import extract_pdf_pages
+
+    return extract_pdf_pages(pdf_path)
+
+@timed("get_pdf_text")
+def get_pdf_text(pdf_path):
+    return "".join(get_pdf_pages(pdf_path))
+
+def resume_index_key(pdf_path, model, chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP):
+    """Content address of the resume index: hash of the PDF bytes + splitter + embedding settings."""
+    digest = hashlib.sha256(Path(pdf_path).read_bytes())
+    settings = {"chunk_size": chunk_size, "chunk_overlap": chunk_overlap, "model": model, "format": INDEX_FORMAT}
+    digest.update(json.dumps(settings, sort_keys=True).encode())
+    return digest.hexdigest()[:16]
+
+def save_resume_index(vectorstore, index_dir):
+    """Persist a FAISS store as index.faiss + chunks.json (no pickles), atomically."""
+    import faiss
+
+    tmp_dir = temp_path_for(index_dir)
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    faiss.write_index(vectorstore.index, str(tmp_dir / "index.faiss"))
+    chunks = []
+    for position in range(vectorstore.index.ntotal):
+        doc_id = vectorstore.index_to_docstore_id[position]
+        doc = vectorstore.docstore.search(doc_id)
+        chunks.append({"id": doc_id, "text": doc.page_content, "metadata": doc.metadata})
+    with open(tmp_dir / "chunks.json", "w", encoding="utf-8") as f:
+        json.dump(chunks, f)
+    try:
+        os.replace(tmp_dir, index_dir)
+    except OSError:
+        # Another replica/session won the race — its index is identical, keep it
+        for leftover in tmp_dir.iterdir():
+            leftover.unlink()
+        tmp_dir.rmdir()
+
+def load_resume_index(index_dir, embeddings):
+    """Memory-map a persisted FAISS index back into a LangChain store (no embedding calls)."""
+    import faiss
+    from langchain_community.docstore.in_memory import InMemoryDocstore
+    from langchain_community.vectorstores import FAISS
+    from langchain_core.documents import Document
+
+    index_file = str(index_dir / "index.faiss")
+    try:
+        index = faiss.read_index(index_file, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+    except RuntimeError:
+        index = faiss.read_index(index_file)
+    with open(index_dir / "chunks.json", "r", encoding="utf-8") as f:
+        chunks = json.load(f)
+    docstore = InMemoryDocstore(
+        {c["id"]: Document(page_content=c["text"], metadata=c["metadata"]) for c in chunks}
+    )
+    index_to_docstore_id = {position: c["id"] for position, c in enumerate(chunks)}
+    return FAISS(embeddings, index, docstore, index_to_docstore_id)
+
+# 📚 Load Resume & Create FAISS Vector Store (once per process, persisted across restarts)
+@timed("load_resume_embeddings")
+@st.cache_resource(show_spinner=True)
+def load_resume_embeddings():
+    """Return ``(vectorstore, index_key)``, or ``(None, None)`` without a resume."""
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
+    from langchain_community.vectorstores import FAISS
+
+    from core.embeddings import get_embeddings
+
+    if not Path(RESUME_PATH).exists():
+        return None, None
+    embeddings, embedding_model = get_embeddings()
+
+    # ♻️ Warm start — reuse the index persisted for this exact PDF + settings
+    index_key = resume_index_key(RESUME_PATH, embedding_model)
+    index_dir = INDEX_CACHE_DIR / index_key
+    if (index_dir / "index.faiss").exists():
+        try:
+            return load_resume_index(index_dir, embeddings), index_key
+        except Exception:
+            pass  # unreadable/partial cache — rebuild below
+
+    pages = get_pdf_pages(RESUME_PATH)
+    if not any(pages):
+        return None, None
+    # Chunks never straddle pages, so each one can cite its page (1-based) and offset within it
+    splitter = RecursiveCharacterTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP, add_start_index=True)
+    docs = splitter.create_documents(pages, metadatas=[{"page": n} for n in range(1, len(pages) + 1)])
+    vectorstore = FAISS.from_documents(docs, embeddings)
+    INDEX_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    save_resume_index(vectorstore, index_dir)
+    return vectorstore, index_key
+
+# 🔎 Keyword search — BM25 over the resume's lines, index built once per distinct text
+@functools.lru_cache(maxsize=4)
+def get_line_search_index(text):
+    from core.search import LexicalIndex
+
+    return LexicalIndex(line.strip() for line in text.split("\n") if line.strip())
+
+def search_resume(query, text):
+    index = get_line_search_index(text)
+    results = [index.snippet(pid, terms) for _, pid, terms in index.search(query, k=6)]
+    return "\n\n".join(results) if results else "No matches found."
@@ -0,0 +1,75 @@
+# core/retrieval.py — FarhunVerse | Hybrid (BM25 + FAISS) retriever for FarhunBot
+#
+# Imported lazily from build_qa_chain, so LangChain stays off the cold-start path.
+
+import os
+
+import streamlit as st
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+
+from core.flight import shared_call
+from core.perf import span
+from core.search import LexicalIndex
+
+# hybrid — fuse BM25 and FAISS rankings; dense — FAISS only (the original behaviour)
+RESUME_RETRIEVAL = os.getenv("RESUME_RETRIEVAL", "hybrid").lower()
+RRF_K = 60  # reciprocal rank fusion damping constant
+
+@st.cache_resource(show_spinner=False)
+def get_chunk_search_index(index_key, _vectorstore):
+    """BM25 index over the FAISS store's chunks, in index order — built once per resume index."""
+    docs = [
+        _vectorstore.docstore.search(_vectorstore.index_to_docstore_id[position])
+        for position in range(_vectorstore.index.ntotal)
+    ]
+    return LexicalIndex(doc.page_content for doc in docs), docs
+
+class HybridRetriever(BaseRetriever):
+    """Reciprocal rank fusion of a dense retriever and a BM25 index over the same chunks."""
+
+    dense: BaseRetriever
+    lexical: LexicalIndex
+    docs: list
+    k: int = 3
+    fetch_k: int = 8
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    def _get_relevant_documents(self, query: str, *, run_manager: CallbackManagerForRetrieverRun) -> list[Document]:
+        scores, by_text = {}, {}
+        dense_docs = self.dense.invoke(query, config={"callbacks": run_manager.get_child()})
+        lexical_docs = [self.docs[pid] for _, pid, _ in self.lexical.search(query, k=self.fetch_k)]
+        for ranking in (dense_docs[: self.fetch_k], lexical_docs):
+            for rank, doc in enumerate(ranking):
+                scores[doc.page_content] = scores.get(doc.page_content, 0.0) + 1.0 / (RRF_K + rank + 1)
+                by_text.setdefault(doc.page_content, doc)
+        best = sorted(scores, key=scores.get, reverse=True)[: self.k]
+        return [by_text[text] for text in best]
+
+class SharedRetriever(BaseRetriever):
+    """Coalesces identical concurrent queries across sessions and runs them under the OpenAI limiter."""
+
+    inner: BaseRetriever
+    key: str
+
+    def _get_relevant_documents(self, query: str, *, run_manager: CallbackManagerForRetrieverRun) -> list[Document]:
+        with span("retrieve"):
+            return shared_call(("retrieve", self.key, query), lambda: self.inner.invoke(query))
+
+def resume_retriever(vectorstore, index_key, k=3):
+    """FarhunBot's retriever: hybrid BM25 + FAISS unless RESUME_RETRIEVAL=dense."""
+    if RESUME_RETRIEVAL == "dense":
+        inner = vectorstore.as_retriever(search_kwargs={"k": k})
+    else:
+        fetch_k = max(8, 2 * k)
+        lexical, docs = get_chunk_search_index(index_key, vectorstore)
+        inner = HybridRetriever(
+            dense=vectorstore.as_retriever(search_kwargs={"k": fetch_k}),
+            lexical=lexical,
+            docs=docs,
+            k=k,
+            fetch_k=fetch_k,
+        )
+    return SharedRetriever(inner=inner, key=f"{RESUME_RETRIEVAL}:{index_key}:{k}")
@@ -0,0 +1,153 @@
+# core/search.py — FarhunVerse | BM25 inverted index with phrase/prefix queries and highlighted snippets
+
+import bisect
+import math
+import re
+from collections import defaultdict
+
+TOKEN_RE = re.compile(r"\w+")
+QUERY_RE = re.compile(r'"([^"]+)"|(\S+)')
+
+# -----------------------------------------------
+# ✂️ TOKENIZE + STEM — a light suffix stripper, enough to match skill/skills, deploying/deployed
+# -----------------------------------------------
+_SUFFIXES = (
+    ("ational", "ate"), ("ization", "ize"), ("fulness", "ful"), ("iveness", "ive"),
+    ("ations", "ate"), ("ation", "ate"), ("ingly", ""), ("edly", ""), ("ments", ""), ("ment", ""),
+    ("ies", "y"), ("ing", ""), ("ers", ""), ("er", ""), ("ed", ""), ("ly", ""), ("es", ""), ("s", ""),
+)
+
+def stem(word):
+    if len(word) <= 3 or word.isdigit():
+        return word
+    for suffix, replacement in _SUFFIXES:
+        if word.endswith(suffix) and not word.endswith("ss") and len(word) - len(suffix) >= 3:
+            return word[: -len(suffix)] + replacement
+    return word
+
+def tokenize(text):
+    """``[(stem, surface, start, end), ...]`` for every word in ``text``."""
+    return [
+        (stem(m.group().lower()), m.group().lower(), m.start(), m.end())
+        for m in TOKEN_RE.finditer(text)
+    ]
+
+# -----------------------------------------------
+# 🔎 BM25 INDEX
+# -----------------------------------------------
+class LexicalIndex:
+    """Inverted index over a list of passages, scored with Okapi BM25.
+
+    Query syntax: plain words are OR-ed and ranked, ``"quoted phrases"``
+    must appear as consecutive words, and ``prefix*`` matches every word
+    starting with ``prefix``.
+    """
+
+    def __init__(self, passages, k1=1.5, b=0.75):
+        self.passages = list(passages)
+        self.k1 = k1
+        self.b = b
+        self.postings = defaultdict(dict)  # stem -> {passage id: [positions]}
+        self.spans = []  # passage id -> [(stem, start, end)] for highlighting
+        self.lengths = []
+        surface_to_stems = defaultdict(set)
+        for pid, passage in enumerate(self.passages):
+            tokens = tokenize(passage)
+            for position, (term, surface, _, _) in enumerate(tokens):
+                self.postings[term].setdefault(pid, []).append(position)
+                surface_to_stems[surface].add(term)
+            self.spans.append([(term, start, end) for term, _, start, end in tokens])
+            self.lengths.append(len(tokens))
+        self.avg_length = (sum(self.lengths) / len(self.lengths)) if self.lengths else 0.0
+        # Sorted surface forms for prefix lookups by bisection
+        self.vocabulary = sorted(surface_to_stems)
+        self.surface_to_stems = dict(surface_to_stems)
+        n = len(self.passages)
+        self.idf = {
+            term: math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in self.postings.items()
+        }
+
+    def __len__(self):
+        return len(self.passages)
+
+    def _expand_prefix(self, prefix):
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        stems = set()
+        for surface in self.vocabulary[start:]:
+            if not surface.startswith(prefix):
+                break
+            stems |= self.surface_to_stems[surface]
+        return stems
+
+    def _phrase_matches(self, terms):
+        """Passage ids containing ``terms`` at consecutive positions."""
+        if any(term not in self.postings for term in terms):
+            return set()
+        candidates = set.intersection(*(set(self.postings[term]) for term in terms))
+        matches = set()
+        for pid in candidates:
+            starts = set(self.postings[terms[0]][pid])
+            for offset, term in enumerate(terms[1:], start=1):
+                starts &= {p - offset for p in self.postings[term][pid]}
+                if not starts:
+                    break
+            if starts:
+                matches.add(pid)
+        return matches
+
+    def parse_query(self, query):
+        """Split a query into ``(scoring terms, required phrases)``."""
+        terms, phrases = set(), []
+        for phrase, word in QUERY_RE.findall(query.lower()):
+            if phrase:
+                phrase_terms = [t for t, _, _, _ in tokenize(phrase)]
+                if phrase_terms:
+                    phrases.append(phrase_terms)
+                    terms.update(phrase_terms)
+            elif word.endswith("*") and len(word) > 1:
+                terms |= self._expand_prefix(word.rstrip("*"))
+            else:
+                terms.update(t for t, _, _, _ in tokenize(word))
+        return terms, phrases
+
+    def search(self, query, k=6):
+        """Top ``k`` ``(score, passage id, matched stems)``, best first."""
+        terms, phrases = self.parse_query(query)
+        allowed = None
+        for phrase in phrases:
+            matched = self._phrase_matches(phrase)
+            allowed = matched if allowed is None else allowed & matched
+        scores = defaultdict(float)
+        for term in terms:
+            idf = self.idf.get(term)
+            if idf is None:
+                continue
+            for pid, positions in self.postings[term].items():
+                if allowed is not None and pid not in allowed:
+                    continue
+                tf = len(positions)
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[pid] / (self.avg_length or 1))
+                scores[pid] += idf * tf * (self.k1 + 1) / (tf + norm)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:k]
+        return [(score, pid, terms) for pid, score in ranked]
+
+    def snippet(self, pid, terms, width=240, mark="**"):
+        """Passage text around the first match, matched words wrapped in ``mark``."""
+        text = self.passages[pid]
+        hits = [(start, end) for term, start, end in self.spans[pid] if term in terms]
+        if not hits:
+            return text[:width].strip()
+        lo = max(0, hits[0][0] - width // 3)
+        hi = min(len(text), lo + width)
+        parts, cursor = [], lo
+        for start, end in hits:
+            if start < lo or end > hi:
+                continue
+            parts.append(text[cursor:start])
+            parts.append(f"{mark}{text[start:end]}{mark}")
+            cursor = end
+        parts.append(text[cursor:hi])
+        prefix = "…" if lo > 0 else ""
+        suffix = "…" if hi < len(text) else ""
+        return prefix + "".join(parts).strip() + suffix
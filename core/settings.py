@@ -0,0 +1,29 @@
+# core/settings.py — FarhunVerse | Environment, paths and shared clients
+
+import os
+import threading
+from pathlib import Path
+
+import streamlit as st
+from dotenv import load_dotenv
+
+load_dotenv()
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+
+# 🗂️ On-disk cache for derived artefacts (FAISS index, image derivatives, ...)
+CACHE_DIR = Path(".cache")
+
+def temp_path_for(path):
+    """Unique sibling temp path (per process + thread) for write-then-os.replace() saves."""
+    path = Path(path)
+    return path.with_name(f".{path.name}.tmp-{os.getpid()}-{threading.get_ident()}")
+
+@st.cache_resource(show_spinner=False)
+def get_openai_http_client():
+    """One pooled httpx client for every session's OpenAI calls — connections stay alive across reruns."""
+    import httpx
+
+    return httpx.Client(
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
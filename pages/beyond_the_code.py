@@ -0,0 +1,246 @@
+# pages/beyond_the_code.py — FarhunVerse | 🌟 Beyond the Code (Fixed HTML Rendering)
+
+import streamlit as st
+
+from core.images import DERIVATIVE_MIME, load_images_from_folder
+
+# 🎨 CSS Styling
+st.markdown("""
+<style>
+.others-section { 
+    padding: 40px 20px; 
+    font-family: "Poppins", sans-serif; 
+}
+
+/* 🌟 Glassmorphic Card with Gradient Glow */
+.glass-card {
+    max-width: 900px;
+    margin: 40px auto;
+    padding: 30px;
+    border-radius: 20px;
+    background: rgba(255,255,255,0.06);
+    backdrop-filter: blur(14px);
+    border: 1px solid rgba(255,255,255,0.15);
+    box-shadow: 0 8px 25px rgba(0,0,0,0.35);
+    position: relative;
+    overflow: hidden;
+    transition: all 0.35s ease-in-out;
+}
+
+/* ✨ Glowing Gradient Border Effect */
+.glass-card::before {
+    content: "";
+    position: absolute;
+    inset: 0;
+    border-radius: 20px;
+    padding: 1px;
+    background: linear-gradient(120deg, #00c6ff, #0072ff);
+    -webkit-mask: 
+        linear-gradient(#fff 0 0) content-box, 
+        linear-gradient(#fff 0 0);
+    -webkit-mask-composite: xor;
+            mask-composite: exclude;
+    opacity: 0;
+    transition: opacity 0.4s ease-in-out;
+}
+
+/* 💫 Hover Animation (Glow + Lift) */
+.glass-card:hover::before {
+    opacity: 1;
+}
+
+.glass-card:hover { 
+    transform: translateY(-6px);
+    box-shadow: 0 12px 30px rgba(0,180,216,0.45);
+}
+
+h2 { 
+    color: #00b4d8; 
+    text-align: center; 
+    font-weight: 800; 
+}
+
+.desc { 
+    font-size: 17px; 
+    opacity: 0.9; 
+    text-align: justify; 
+    margin-bottom: 20px; 
+}
+
+.quote { 
+    text-align: center; 
+    color: #00c6ff; 
+    font-style: italic; 
+    font-weight: 600; 
+    margin-top: 15px; 
+}
+
+.slideshow {
+    position: relative; 
+    width: 100%; 
+    max-width: 820px; 
+    height: 440px;
+    margin: 20px auto; 
+    border-radius: 18px; 
+    overflow: hidden;
+    box-shadow: 0 10px 25px rgba(0,0,0,0.4);
+}
+
+.slides {
+    display: flex; 
+    animation: fadeSlide 25s infinite;
+}
+
+.slides picture {
+    width: 100%;
+    flex-shrink: 0;
+}
+
+.slides img {
+    width: 100%; 
+    height: 440px; 
+    object-fit: contain;
+    background: #000; 
+    border-radius: 18px; 
+    flex-shrink: 0;
+}
+
+@keyframes fadeSlide {
+    0%,20% {transform: translateX(0);}
+    25%,40% {transform: translateX(-100%);}
+    45%,60% {transform: translateX(-200%);}
+    65%,80% {transform: translateX(-300%);}
+    85%,100% {transform: translateX(0);}
+}
+</style>
+""", unsafe_allow_html=True)
+
+def generate_slideshow(images):
+    imgs_html = ""
+    for sources in images:
+        fallback = sources.get("jpeg") or next(iter(sources.values()))
+        source_tags = "".join(
+            f'<source srcset="{sources[fmt]}" type="{DERIVATIVE_MIME[fmt]}">'
+            for fmt in ("webp",)
+            if fmt in sources and sources[fmt] != fallback
+        )
+        imgs_html += f'<picture>{source_tags}<img src="{fallback}" loading="lazy" decoding="async"></picture>'
+    return f'<div class="slideshow"><div class="slides">{imgs_html}</div></div>'
+
+st.markdown("<div class='others-section'>", unsafe_allow_html=True)
+
+# 🌟 Section Title
+st.markdown("""
+    <div style="
+        text-align:center; 
+        margin-bottom: 60px;
+        ">
+        <h1 style="
+            background: linear-gradient(90deg, #00c6ff, #0072ff);
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            font-size: 42px;
+            font-weight: 900;
+            letter-spacing: 1px;
+        ">
+            🚀 Beyond the Code
+        </h1>
+        <p style="
+            font-size: 18px; 
+            opacity: 0.85; 
+            max-width: 800px; 
+            margin: 10px auto 0; 
+            line-height: 1.6;
+        ">
+            A glimpse into my world outside of tech — where passion meets creativity.  
+            From the adrenaline of football fields to the calm rhythm of music, this is where I recharge, grow, and stay inspired.
+        </p>
+    </div>
+""", unsafe_allow_html=True)
+
+# 🖼️ Text renders first; each slideshow fills its slot once its photos are ready
+slideshow_slots = {}
+
+def slideshow_placeholder():
+    # Empty slideshow box reserves the 440px so the page doesn't jump when photos arrive
+    slot = st.empty()
+    slot.markdown('<div class="slideshow"></div>', unsafe_allow_html=True)
+    return slot
+
+# ⚽ Football
+st.markdown("""
+<div class="glass-card">
+    <h2>⚽ Football — My Passion</h2>
+    <p class="desc">
+        Football isn’t just a sport for me — it’s an emotion that defines my rhythm of life.
+        Watching matches and playing the game gives me an adrenaline rush like no other.
+        The strategy, teamwork, and thrill of a perfect goal always remind me why I fell in love with football.
+        My inspiration? The one and only <b>Eden Hazard</b> — whose elegance and creativity on the field never fail to amaze me.
+    </p>
+</div>
+""", unsafe_allow_html=True)
+slideshow_slots["football"] = slideshow_placeholder()
+st.markdown('<p class="quote">"When I have the ball at my feet, I’m the happiest person on Earth." 🥅</p>', unsafe_allow_html=True)
+
+# 💡 Hackathons
+st.markdown("""
+<div class="glass-card">
+    <h2>💡 Hackathons — The Game Changer</h2>
+    <p class="desc">
+        Hackathons have shaped who I am as a technologist.
+        They’ve helped me win over ₹3,00,000 across multiple events and explore domains like AI, Machine Learning, Blockchain, and DevOps.
+        Every hackathon I’ve participated in taught me something invaluable — from teamwork and time management to hands-on coding experience.
+        I firmly believe that <b>knowledge grows when you build, not when you just read</b>.
+    </p>
+</div>
+""", unsafe_allow_html=True)
+slideshow_slots["hackathons"] = slideshow_placeholder()
+st.markdown('<p class="quote">"Learning by doing is the only way to stand out in a crowd of learners." 🚀</p>', unsafe_allow_html=True)
+
+# 👔 Modelling
+st.markdown("""
+<div class="glass-card">
+    <h2>👔 Modelling — Confidence Meets Style</h2>
+    <p class="desc">
+        Modelling is more than just posing for pictures — it’s about confidence, expression, and owning who you are.
+        I’ve developed courage and self-assurance through it, and it has become an art that reflects my personality.
+        No matter what happens, two things never fade away from me — <b>Smile and Style</b>.
+    </p>
+</div>
+""", unsafe_allow_html=True)
+slideshow_slots["modelling"] = slideshow_placeholder()
+st.markdown('<p class="quote">"Smile and Style — my unshakable constants in life." 😎</p>', unsafe_allow_html=True)
+
+# 🏋️‍♂️ Gym
+st.markdown("""
+<div class="glass-card">
+    <h2>🏋️‍♂️ Fitness — Aging Like Fine Wine</h2>
+    <p class="desc">
+        Staying fit is my top priority. I believe that health is the foundation of every success.
+        My dream is to age like fine wine — strong, flexible, and full of vitality, even in my 60s.
+        I draw my inspiration from personalities like <b>Nagarjuna</b>, who prove that age is just a number when you take care of your body.
+    </p>
+</div>
+""", unsafe_allow_html=True)
+slideshow_slots["gym"] = slideshow_placeholder()
+st.markdown('<p class="quote">"Train hard, stay humble, and let your discipline speak louder than words." 💪</p>', unsafe_allow_html=True)
+
+# 🎧 Music
+st.markdown("""
+<div class="glass-card">
+    <h2>🎧 Music — My Soul’s Escape</h2>
+    <p class="desc">
+        Music heals me in ways words can’t describe.
+        I often find myself dancing alone, lost in the rhythm of my favorite Tamil classics and English hits.
+        It’s my way of resetting — a quiet joy that fuels my creativity and focus.
+    </p>
+</div>
+""", unsafe_allow_html=True)
+slideshow_slots["music"] = slideshow_placeholder()
+st.markdown('<p class="quote">"When words fail, music speaks." 🎵</p>', unsafe_allow_html=True)
+
+st.markdown("</div>", unsafe_allow_html=True)
+
+# 📸 Second pass — load photos per section, top to bottom (browser lazy-loads the files)
+for folder, slot in slideshow_slots.items():
+    slot.markdown(generate_slideshow(load_images_from_folder(f"photos/{folder}")), unsafe_allow_html=True)
@@ -0,0 +1,78 @@
+# pages/contact.py — FarhunVerse | 📬 Contact
+
+from email.message import EmailMessage
+
+import streamlit as st
+
+from core.data import SOCIALS
+from core.lazy import st_lottie
+from core.lottie import LOTTIE_URLS, load_lottie_url
+from core.mailer import EMAIL_USER, get_mail_outbox, smtp_configured
+from core.perf import timed
+
+lottie_connect = load_lottie_url(LOTTIE_URLS["connect"])
+
+st.markdown("## 📬 Let's Connect")
+col1, col2 = st.columns([2, 1])
+
+RECEIVER_EMAIL = "farhunhazard@gmail.com"  # You’ll receive all messages here
+
+@timed("send_email")
+def send_email(name, sender_email, message):
+    if not smtp_configured():
+        st.error("❌ Failed to send email: EMAIL_USER / EMAIL_PASS are not configured.")
+        return False
+    try:
+        msg = EmailMessage()
+        msg["Subject"] = f"📩 New Message from {name} — FarhunVerse Portfolio"
+        msg["From"] = EMAIL_USER or RECEIVER_EMAIL
+        msg["To"] = RECEIVER_EMAIL
+        msg.set_content(
+            f"""
+Hey Farhun 👋,
+
+You just got a new message from your FarhunVerse portfolio site!
+
+🧑 Name: {name}
+📧 Email: {sender_email}
+
+💬 Message:
+{message}
+
+----------------------------
+This email was automatically sent from your Streamlit portfolio.
+            """
+        )
+
+        # Queue it — the outbox worker delivers over a reused SMTP connection, with retries
+        get_mail_outbox().enqueue(msg)
+        return True
+    except Exception as e:
+        st.error(f"❌ Failed to queue email: {e}")
+        return False
+
+with col1:
+    with st.form("contact_form"):
+        name = st.text_input("Your Name")
+        email = st.text_input("Your Email")
+        message = st.text_area("Your Message")
+
+        submitted = st.form_submit_button("Send Message")
+        if submitted:
+            if not name or not email or not message:
+                st.warning("⚠️ Please fill in all fields before submitting.")
+            else:
+                if send_email(name, email, message):
+                    st.success(f"✅ Thanks {name}! Your message is on its way.")
+                    st.balloons()
+                else:
+                    st.error("❌ Something went wrong. Please try again later.")
+
+    st.markdown("---")
+    st.markdown("### 🌐 Connect on Other Platforms")
+    for platform, link in SOCIALS.items():
+        st.markdown(f"- [{platform}]({link})")
+
+with col2:
+    if lottie_connect:
+        st_lottie(lottie_connect, height=250, key="contact_lottie")
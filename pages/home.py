@@ -0,0 +1,335 @@
+# pages/home.py — FarhunVerse | 🏠 Home (Fixed header + Lottie)
+
+import streamlit as st
+
+from core.data import SOCIALS
+from core.images import image_src
+from core.lazy import st_lottie
+from core.lottie import LOTTIE_URLS, load_lottie_url
+
+# ✅ Served from the local Lottie cache — never blocks on the network
+lottie_ai = load_lottie_url(LOTTIE_URLS["ai"])
+lottie_code = load_lottie_url(LOTTIE_URLS["code"])
+lottie_connect = load_lottie_url(LOTTIE_URLS["connect"])
+
+st.markdown(
+    """
+    <style>
+    /* 🎨 HERO SECTION STYLING */
+    .hero-section {
+        display: flex;
+        align-items: center;
+        justify-content: flex-start;
+        flex-wrap: wrap;
+        gap: 30px; /* tighter spacing between name and image */
+        padding: 40px 0;
+    }
+
+    .hero-text {
+        flex: 1 1 auto;
+        min-width: 300px;
+    }
+
+    h1.hero {
+        background: linear-gradient(90deg, #00c6ff, #0072ff);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        font-size: clamp(34px, 5vw, 52px);
+        font-weight: 800;
+        line-height: 1.2;
+        margin-bottom: 12px;
+    }
+
+    .tagline {
+        font-size: 18px;
+        color: var(--text-color);
+        opacity: 0.85;
+        line-height: 1.6;
+        margin-bottom: 20px;
+    }
+
+    .hero-image {
+        flex: 0 0 260px; /* 💥 Larger image container */
+        display: flex;
+        justify-content: center;
+        align-items: center;
+        margin-top: -25px; /* visually aligns image closer to text */
+    }
+
+    .hero-image img {
+        width: 260px; /* 💥 Larger circular photo */
+        height: 260px;
+        border-radius: 50%;
+        object-fit: cover;
+        box-shadow: 0 10px 25px rgba(0, 0, 0, 0.4);
+        border: 4px solid rgba(0, 114, 255, 0.2); /* subtle glowing border */
+        transition: transform 0.35s ease, box-shadow 0.35s ease;
+    }
+
+    .hero-image img:hover {
+        transform: scale(1.08);
+        box-shadow: 0 14px 30px rgba(0, 114, 255, 0.5);
+    }
+
+    /* 📱 Responsive Design */
+    @media screen and (max-width: 900px) {
+        .hero-section {
+            flex-direction: column;
+            text-align: center;
+            gap: 15px;
+        }
+        .hero-text {
+            flex: 1 1 100%;
+        }
+        .hero-image {
+            margin-top: 10px;
+        }
+        .hero-image img {
+            width: 180px;
+            height: 180px;
+        }
+    }
+    </style>
+    """,
+    unsafe_allow_html=True,
+)
+
+# ✅ Load image safely (static URL, or base64 when static serving is off)
+img_path = "photo.jpeg"
+try:
+    img_src = image_src(img_path)
+except Exception as e:
+    st.error(f"⚠️ Could not load image: {e}")
+    img_src = ""
+
+# 🧠 Hero Section Layout
+st.markdown(
+    f"""
+    <div class="hero-section">
+        <div class="hero-text">
+            <h1 class="hero">👋 Hi, I'm Mohamed&nbsp;Farhun&nbsp;M</h1>
+            <p class="tagline">
+                💻 AI-driven Technologist | Linux & Cloud Engineer @ HCL<br>
+                ⚙️ Specializing in DevOps, GenAI, and Automation Infrastructure.<br>
+                🚀 Passionate about building self-healing, intelligent systems.
+            </p>
+            <div>
+                <p style="margin-bottom: 10px;">🏆 Multi-time Hackathon Winner — Celo, NEAR, Rootstock, Daisi</p>
+                <a href="{SOCIALS['Devpost']}" target="_blank" style="color: #00b4d8; font-weight: 600; text-decoration: none;">🌐 View My Devpost Portfolio</a>
+            </div>
+        </div>
+        <div class="hero-image">
+            <img src="{img_src}" alt="Mohamed Farhun M">
+        </div>
+    </div>
+    """,
+    unsafe_allow_html=True,
+)
+
+st.markdown("---")
+st.subheader("✨ Highlights")
+cols = st.columns(3)
+with cols[0]:
+    if lottie_code:
+        st_lottie(lottie_code, height=140)
+    st.markdown("**AI & Automation Enthusiast**<br>Integrating AI with Linux systems.", unsafe_allow_html=True)
+with cols[1]:
+    if lottie_connect:
+        st_lottie(lottie_connect, height=140)
+    st.markdown("**Hackathon Builder**<br>Winning with creativity and execution.", unsafe_allow_html=True)
+with cols[2]:
+    if lottie_ai:
+        st_lottie(lottie_ai, height=140)
+    st.markdown("**Continuous Learner**<br>Always exploring the next frontier.", unsafe_allow_html=True)
+
+# --- About Me Section ---
+st.markdown("---")
+st.markdown("## 👨‍💻 About Me")
+about_col1, about_col2 = st.columns([1.5, 1])
+with about_col1:
+    st.write(
+        """
+        I'm **Mohamed Farhun M**, an AI-driven technologist passionate about designing intelligent,
+        self-healing infrastructures that bridge **AI, DevOps, and Cloud Engineering**.  
+        At HCLTech, I specialize in **Linux, GenAI, and Automation frameworks** that make systems smarter and scalable.  
+        I believe in building meaningful tech that solves real-world problems — 
+        from decentralized payrolls to analytics dashboards powered by blockchain and machine learning.  
+        Beyond code, I’m an explorer of emerging tech ecosystems like **Web3, Edge AI, and LLM frameworks**.
+        """
+    )
+    st.info("🧠 Motto: *Innovate with purpose, automate with intelligence.*")
+
+with about_col2:
+    about_lottie = load_lottie_url(LOTTIE_URLS["about"])
+    if about_lottie:
+        st_lottie(about_lottie, height=240, key="about_anim")
+
+# --- Timeline Section (Animated + Theme-Responsive + Lottie Rocket) ---
+# --- Timeline Section (with fallback rocket Lottie) ---
+st.markdown("---")
+st.markdown("## 🕒 My Journey Timeline")
+
+# 🚀 Add rocket animation at top (fallback-safe)
+try:
+    st_lottie(load_lottie_url(LOTTIE_URLS["rocket"]), height=120, key="rocket_anim")
+except Exception:
+    st.write("")
+
+st.markdown(
+    """
+    <style>
+    /* 🎨 Universal Style – theme-safe */
+    .timeline { position: relative; max-width: 900px; margin: 60px auto; overflow: hidden; }
+    .timeline::after {
+        content: '';
+        position: absolute;
+        width: 4px;
+        background: linear-gradient(180deg, #00b4d8, #ff61a6);
+        top: 0;
+        bottom: 0;
+        left: 50%;
+        margin-left: -2px;
+        animation: fadeInLine 2s ease-in-out;
+    }
+
+    .timeline-item { opacity: 0; transform: translateY(40px); animation: fadeInUp 1s forwards ease-out; }
+    .timeline-item:nth-child(1) { animation-delay: 0.3s; }
+    .timeline-item:nth-child(2) { animation-delay: 0.6s; }
+    .timeline-item:nth-child(3) { animation-delay: 0.9s; }
+    .timeline-item:nth-child(4) { animation-delay: 1.2s; }
+    .timeline-item:nth-child(5) { animation-delay: 1.5s; }
+    .timeline-item:nth-child(6) { animation-delay: 1.8s; }
+
+    @keyframes fadeInUp { from { opacity: 0; transform: translateY(40px); } to { opacity: 1; transform: translateY(0); } }
+    @keyframes fadeInLine { from { height: 0; } to { height: 100%; } }
+    @keyframes pulseGlow { 0% { box-shadow: 0 0 6px #00b4d8; } 50% { box-shadow: 0 0 20px #ff61a6; } 100% { box-shadow: 0 0 6px #00b4d8; } }
+
+    .container { padding: 20px 40px; position: relative; width: 50%; }
+    .container::after {
+        content: '';
+        position: absolute;
+        width: 18px; height: 18px;
+        right: -9px; top: 25px;
+        background-color: #00b4d8;
+        border-radius: 50%; z-index: 1;
+        animation: pulseGlow 2.5s infinite ease-in-out;
+    }
+
+    .left { left: 0; }
+    .right { left: 50%; }
+
+    .left::before, .right::before {
+        content: " "; height: 0; position: absolute; top: 33px;
+        border: medium solid #00b4d8;
+    }
+    .left::before { right: 30px; border-width: 10px 0 10px 10px; border-color: transparent transparent transparent #00b4d8; }
+    .right::before { left: 30px; border-width: 10px 10px 10px 0; border-color: transparent #00b4d8 transparent transparent; }
+
+    .content {
+        padding: 20px 30px;
+        border-radius: 12px;
+        background: rgba(255, 255, 255, 0.1);
+        backdrop-filter: blur(8px);
+        border: 1px solid rgba(255, 255, 255, 0.15);
+        transition: transform 0.3s ease, box-shadow 0.3s ease, border 0.3s ease;
+        color: #fff;  /* Default text color for dark mode */
+    }
+
+    /* Force text color for dark/light mode */
+    .content h4 {
+        color: #00FFFF !important; 
+    }
+    .content p {
+        color: #FFD700 !important; 
+    }
+
+    /* 🩶 Light mode overrides */
+    @media (prefers-color-scheme: light) {
+        .content {
+            background: rgba(0,0,0,0.05);
+            border: 1px solid rgba(0,0,0,0.1);
+            color: #000; /* text color for light mode */
+        }
+    }
+
+    .content:hover {
+        transform: translateY(-6px);
+        border: 1px solid #00b4d8;
+        box-shadow: 0 6px 16px rgba(0, 180, 216, 0.4);
+    }
+
+    @media screen and (max-width: 600px) {
+        .timeline::after { left: 31px; }
+        .container { width: 100%; padding-left: 70px; padding-right: 25px; }
+        .container::after { left: 15px; }
+        .right { left: 0%; }
+        .right::before { left: 60px; border-width: 10px 0 10px 10px; border-color: transparent transparent transparent #00b4d8; }
+    }
+    </style>
+
+    <div class="timeline">
+        <div class="timeline-item container left">
+            <div class="content">
+                <h4>🎓 2020 — Started B.Tech in IT</h4>
+                <p>Developed strong fundamentals in Computer Science, AI, and Linux systems.</p>
+            </div>
+        </div>
+        <div class="timeline-item container right">
+            <div class="content">
+                <h4>🏆 2021 — Won First Blockchain Hackathon</h4>
+                <p>Built a decentralized payroll prototype integrating smart contracts.</p>
+            </div>
+        </div>
+        <div class="timeline-item container left">
+            <div class="content">
+                <h4>👨🏻‍💻2022 — Explored AI & ML</h4>
+                <p>Developed early models using Scikit-learn and Streamlit dashboards.</p>
+            </div>
+        </div>
+        <div class="timeline-item container right">
+            <div class="content">
+                <h4>🚀 2023 — Built NEARVision & FusePay</h4>
+                <p>Delivered hackathon-winning blockchain analytics and payroll platforms.</p>
+            </div>
+        </div>
+        <div class="timeline-item container left">
+            <div class="content">
+                <h4>💼 2024 — Joined HCLTech</h4>
+                <p>Working on Linux, AI integrations, and GenAI automation in infrastructure.</p>
+            </div>
+        </div>
+        <div class="timeline-item container right">
+            <div class="content">
+                <h4>⚙️ 2025 — AI + Infra Specialist</h4>
+                <p>Leading projects combining generative AI, cloud & automation for scalable systems.</p>
+            </div>
+        </div>
+    </div>
+    """,
+    unsafe_allow_html=True,
+)
+
+# --- Certifications Section ---
+st.markdown("---")
+st.markdown("## 🏅 Certifications & Recognitions")
+st.markdown(
+    """
+    - **AWS Certified Cloud Practitioner** ☁️  
+    - **Linux Foundation Training** 🐧  
+    - **Winner — Build with Celo 5 (Decentralized Payroll)** 🥇  
+    - **Winner — Rootstock x Miami Hack Week (Blockchain AgriTech)** 🏆  
+    - **Finalist — Daisi Hackathon (AI + ML Challenge)** 🎯  
+    """
+)
+
+# --- Tech Philosophy Section ---
+st.markdown("---")
+st.markdown(
+    """
+    <div style='text-align:center; padding:25px; font-size:20px; font-style:italic;'>
+    “Technology isn’t about replacing people — it’s about augmenting potential.”  
+    <br>— <b>Mohamed Farhun M</b>
+    </div>
+    """,
+    unsafe_allow_html=True,
+)
@@ -0,0 +1,82 @@
+# pages/resume_navigator.py — FarhunVerse | 🤖 AI Resume Navigator
+
+from pathlib import Path
+
+import streamlit as st
+
+from core.chat import get_answer_cache, get_session_qa_chain, normalize_question, stream_answer
+from core.data import RESUME_PATH
+from core.history import ChatHistory
+from core.resume import load_resume_embeddings
+
+st.markdown("## FarhunBot — Resume Assistant (LangChain + OpenAI) 🎯")
+
+# --- Resume Download ---
+if Path(RESUME_PATH).exists():
+    with open(RESUME_PATH, "rb") as f:
+        st.download_button("📄 Download My Resume", f, file_name="Mohamed_Farhun_Resume.pdf", mime="application/pdf")
+else:
+    st.warning("⚠️ Resume file not found!")
+
+# --- Maintain chat within same page only ---
+if not isinstance(st.session_state.get("current_chat"), ChatHistory):
+    st.session_state.current_chat = ChatHistory()
+if "active_page" not in st.session_state:
+    st.session_state.active_page = "📝 AI Resume Navigator"
+
+# 🧹 Clear chat automatically if user switched pages
+if st.session_state.active_page != "📝 AI Resume Navigator":
+    st.session_state.current_chat.clear()
+    st.session_state.active_page = "📝 AI Resume Navigator"
+
+st.markdown("---")
+st.write("💬 Ask me anything about my resume, skills, or experience — I’ll answer like Mohamed Farhun himself!")
+
+# --- Load Resume & FAISS Vector Store ---
+vectorstore, index_key = load_resume_embeddings()
+if not vectorstore:
+    st.error("❌ Could not load or embed resume.")
+else:
+    # --- Chat UI — only the newest messages are drawn; older turns live on as a summary ---
+    chat = st.session_state.current_chat
+    if chat.hidden_count():
+        # Fixed label + callback: the window widens before this rerun draws the messages
+        st.button("⬆️ Load earlier messages", key="load_earlier_chat", on_click=chat.show_earlier)
+    elif chat.evicted:
+        st.caption(f"🗜️ {chat.evicted} earlier messages were summarized to keep this chat light.")
+    for msg in chat.visible():
+        with st.chat_message(msg.role):
+            st.markdown(msg.content)
+
+    if user_query := st.chat_input("💬 Ask FarhunBot..."):
+        # Built once per session; its memory is reloaded from current_chat (summary + recent turns)
+        qa_chain = get_session_qa_chain(vectorstore, index_key, chat)
+        chat.append("user", user_query)
+        with st.chat_message("user"):
+            st.markdown(user_query)
+
+        # Only opening questions are cached or shared — follow-ups depend on the conversation
+        is_opening = chat.total == 1
+        answer_cache = get_answer_cache(index_key, vectorstore.embeddings)
+        with st.chat_message("assistant"):
+            with st.spinner("Thinking... 🤔"):
+                answer, query_vector = answer_cache.lookup(user_query) if is_opening else (None, None)
+                if answer is None:
+                    # Identical concurrent opening questions share one upstream call
+                    flight_key = (index_key, normalize_question(user_query)) if is_opening else None
+                    tokens = stream_answer(qa_chain, user_query, flight_key=flight_key)
+                    first_token = next(tokens, "")  # spinner only until the first token arrives
+
+            if answer is not None:
+                st.markdown(answer)
+                qa_chain.memory.save_context({"question": user_query}, {"answer": answer})
+            else:
+                def answer_stream():
+                    yield first_token
+                    yield from tokens
+
+                answer = st.write_stream(answer_stream())
+                if is_opening:
+                    answer_cache.store(user_query, answer, query_vector)
+
+        chat.append("assistant", answer)
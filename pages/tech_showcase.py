@@ -0,0 +1,161 @@
+# pages/tech_showcase.py — FarhunVerse | 🚀 Tech Showcase (Interactive Projects + Skills)
+
+import streamlit as st
+
+# Figures are built + serialized once and replayed from st.cache_data on reruns
+from core.charts import cached_plotly_chart
+from core.data import FRAMEWORK_PROFICIENCY, LANGUAGE_EFFICIENCY, SKILLS
+from core.lazy import st_lottie
+from core.lottie import load_lottie_file
+from core.projects import CATEGORIES, get_project_catalog
+
+# Loaded + validated once per process; categories, card HTML and the category index are precomputed
+catalog = get_project_catalog()
+
+# Initialize video states
+for i, _ in enumerate(catalog.projects):
+    st.session_state.setdefault(f"play_video_{i}", False)
+
+st.markdown("## 🚀 Tech Showcase — Projects & Skills")
+st.markdown("Explore my award-winning hackathon projects and the technology stack that powers them.")
+st.markdown("---")
+
+# --- Filter Chips ---
+if "selected_category" not in st.session_state:
+    st.session_state.selected_category = "All"
+
+st.markdown("### 🔍 Filter by Category")
+filter_cols = st.columns(len(CATEGORIES))
+for i, cat in enumerate(CATEGORIES):
+    button_style = (
+        "background-color: #00b4d8; color: white; font-weight:600;"
+        if st.session_state.selected_category == cat
+        else "background-color: rgba(0,0,0,0.05); color: var(--text-color);"
+    )
+    if filter_cols[i].button(f"🎯 {cat}", key=f"cat_{cat}", use_container_width=True):
+        st.session_state.selected_category = cat
+
+# --- CSS Styling (Center aligned + animation) ---
+st.markdown("""
+<style>
+.project-row {
+     display: flex;
+    justify-content: center;
+    align-items: stretch;
+    gap: 25px;                /* spacing between animation & card */
+    width: 90%;
+    max-width: 1100px;
+    padding: 15px 0;          /* adds space above and below each row */
+    margin-bottom: 20px;      /* vertical gap between cards */
+    flex-wrap: wrap;
+}
+.project-card {
+    flex: 1;
+    display: flex;
+    flex-direction: column;
+    justify-content: space-between;
+    height: 100%;
+    backdrop-filter: blur(10px);
+    border-radius: 20px;
+    padding: 25px;
+    border: 1px solid rgba(255, 255, 255, 0.15);
+    background: rgba(255, 255, 255, 0.05);
+    transition: transform 0.4s ease, box-shadow 0.4s ease;
+    animation: slideInLeft 1s ease forwards;
+    box-sizing: border-box;
+    margin-bottom: 5px;
+}
+.project-card.right { animation: slideInRight 1s ease forwards;text-align: left; }
+.project-card:hover {
+    transform: translateY(-8px);
+    box-shadow: 0 10px 25px rgba(0, 180, 216, 0.45);
+    border-color: #00b4d8;
+}
+@keyframes slideInLeft {
+    from {opacity: 0; transform: translateX(-100px);}
+    to {opacity: 1; transform: translateX(0);}
+}
+@keyframes slideInRight {
+    from {opacity: 0; transform: translateX(100px);}
+    to {opacity: 1; transform: translateX(0);}
+}
+.project-card h3 {
+    background: linear-gradient(90deg, #00c6ff, #0072ff);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    font-weight: 800; font-size: 22px; margin-bottom: 10px;
+}
+.stack-badge {
+    display: inline-block;
+    background: rgba(0, 180, 216, 0.15);
+    color: #00b4d8;
+    border: 1px solid rgba(0,180,216,0.3);
+    border-radius: 12px;
+    padding: 3px 10px;
+    margin: 2px;
+    font-size: 13px;
+}
+.proj-links a { text-decoration: none; margin-right: 10px; font-weight: 600; }
+.proj-links a:hover { text-decoration: underline; }
+
+@media (prefers-color-scheme: light) {
+    .project-card {
+        background: rgba(0,0,0,0.05);
+        border: 1px solid rgba(0,0,0,0.1);
+    }
+    .stack-badge {
+        background: rgba(0,0,0,0.05);
+        color: #0072ff;
+    }
+}
+@keyframes fadeIn {
+    from {opacity: 0; transform: translateY(30px);}
+    to {opacity: 1; transform: translateY(0);}
+}
+.project-card, .project-row {
+    animation: fadeIn 1s ease forwards;
+}
+</style>
+""", unsafe_allow_html=True)
+
+# --- Filtered Projects (a dictionary lookup) ---
+filtered_projects = catalog.filter(st.session_state.selected_category)
+
+# --- Render Projects with Alternating Animations ---
+st.markdown("<div class='project-grid'>", unsafe_allow_html=True)
+for idx, proj in enumerate(filtered_projects):
+    is_left = idx % 2 == 0
+    lottie_obj = load_lottie_file(proj.lottie) if proj.lottie else None
+
+    st.markdown("<div class='project-row'>", unsafe_allow_html=True)
+    col_left, col_right = st.columns([1.2, 1.2])
+    with col_left if is_left else col_right:
+        if lottie_obj:
+            st_lottie(lottie_obj, height=220, speed=1, key=f"proj_lottie_{idx}")
+    with col_right if is_left else col_left:
+        side_class = "right" if not is_left else ""
+        st.markdown(proj.card_html(side_class), unsafe_allow_html=True)
+    st.markdown("</div>", unsafe_allow_html=True)
+st.markdown("<div>", unsafe_allow_html=True)
+
+# --- Skills Section ---
+st.markdown("---")
+st.markdown("## 🧠 Core Technical Skills")
+st.write("Here’s a visualization of my core proficiencies:")
+
+cached_plotly_chart("radar", SKILLS, template="plotly_dark")
+for category, items in SKILLS.items():
+    st.markdown(f"### {category}")
+    st.markdown(" ".join([f"<span class='stack-badge'>{i}</span>" for i in items]), unsafe_allow_html=True)
+
+st.markdown("---")
+
+st.markdown("### 💻 Programming Languages Efficiency")
+cached_plotly_chart("languages", LANGUAGE_EFFICIENCY)
+
+st.markdown("---")
+
+st.markdown("### 🧱 Frameworks & Tools Expertise")
+cached_plotly_chart("frameworks", FRAMEWORK_PROFICIENCY)
+
+st.markdown("<br><hr><center>🧠 Continuously growing across AI, Data Science, and Blockchain innovation.</center>", unsafe_allow_html=True)
@@ -0,0 +1,47 @@
+# tests/test_pdftext.py — FarhunVerse | Incremental resume text extraction
+
+import shutil
+from pathlib import Path
+
+import pytest
+from PyPDF2 import PageObject, PdfReader
+
+from core import pdftext
+
+RESUME = Path(__file__).resolve().parent.parent / "resume.pdf"
+
+@pytest.fixture
+def resume(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdftext, "PDF_TEXT_CACHE_DIR", tmp_path / "pdf_text")
+    pdf_path = tmp_path / "resume.pdf"
+    shutil.copy(RESUME, pdf_path)
+    return pdf_path
+
+@pytest.fixture
+def extractions(monkeypatch):
+    """Count PageObject.extract_text calls made in-process."""
+    calls = []
+    original = PageObject.extract_text
+
+    def counting(self, *args, **kwargs):
+        calls.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(PageObject, "extract_text", counting)
+    return calls
+
+def test_page_hash_is_stable_across_readers():
+    first = [pdftext._page_hash(page) for page in PdfReader(RESUME).pages]
+    second = [pdftext._page_hash(page) for page in PdfReader(RESUME).pages]
+    assert first == second
+
+def test_reopened_pdf_reextracts_no_pages(resume, extractions):
+    texts = pdftext.extract_pdf_pages(resume)
+    assert len(extractions) == len(texts) > 0
+
+    # Same pages, different file bytes: the file-level hash misses and every page is matched by hash
+    with open(resume, "ab") as f:
+        f.write(b"\n% touched\n")
+    extractions.clear()
+    assert pdftext.extract_pdf_pages(resume) == texts
+    assert extractions == []